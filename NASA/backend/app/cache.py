@@ -7,7 +7,8 @@ and in-memory last resort for optimal performance and reliability.
 import time
 import asyncio
 import json
-from typing import Any, Optional, Dict
+import orjson
+from typing import Any, Awaitable, Callable, Optional, Dict
 from .config import settings, logger
 import aiosqlite
 import os
@@ -19,6 +20,23 @@ except ImportError:
     aioredis = None
     logger.warning("Redis not available, using SQLite fallback")
 
+# Binary serializer for the Redis and SQLite tiers: msgpack when available (smaller and
+# faster to decode than JSON), otherwise orjson
+try:
+    import ormsgpack
+
+    def _dumps(value: Any) -> bytes:
+        return ormsgpack.packb(value, option=ormsgpack.OPT_NON_STR_KEYS | ormsgpack.OPT_NAIVE_UTC)
+
+    _loads = ormsgpack.unpackb
+except ImportError:
+    logger.warning("ormsgpack not available, caching with orjson")
+
+    def _dumps(value: Any) -> bytes:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+
+    _loads = orjson.loads
+
 class InMemoryCache:
     """In-memory cache with TTL support - last resort fallback."""
     
@@ -69,6 +87,27 @@ class InMemoryCache:
         oldest_key = min(self._access_times, key=self._access_times.get)
         self._cleanup_key(oldest_key)
 
+class SingleFlight:
+    """Coalesces concurrent calls for the same key into a single in-flight fetch."""
+    
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    async def do(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Run fetch() once per key; concurrent callers await the same result."""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._forget(key, t))
+        # Shield so a cancelled caller doesn't cancel the fetch shared by the others
+        return await asyncio.shield(task)
+
+    def _forget(self, key: str, task: asyncio.Task):
+        """Drop a finished fetch so the next call goes upstream again."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
 class SQLiteCache:
     """SQLite-based cache for persistent fallback storage."""
     
@@ -107,11 +146,9 @@ class SQLiteCache:
             raise
 
     async def get(self, key: str) -> Optional[Any]:
-        """Get value from SQLite cache."""
-        if not self._initialized:
-            return None
-            
+        """Get value from SQLite cache, creating the database on first use."""
         try:
+            await self.init()
             async with aiosqlite.connect(self.db_path) as db:
                 # Clean expired entries first
                 await db.execute(
@@ -126,7 +163,8 @@ class SQLiteCache:
                 ) as cursor:
                     row = await cursor.fetchone()
                     if row:
-                        return json.loads(row[0])
+                        # Rows written before the binary serializer are JSON text
+                        return json.loads(row[0]) if isinstance(row[0], str) else _loads(row[0])
                     return None
                     
         except Exception as e:
@@ -134,19 +172,17 @@ class SQLiteCache:
             return None
 
     async def set(self, key: str, value: Any, ttl: int = 300):
-        """Set value in SQLite cache."""
-        if not self._initialized:
-            return
-            
+        """Set value in SQLite cache, creating the database on first use."""
         try:
+            await self.init()
             expires_at = time.time() + ttl
             created_at = time.time()
-            value_json = json.dumps(value)
+            value_bytes = _dumps(value)
             
             async with aiosqlite.connect(self.db_path) as db:
                 await db.execute(
                     "INSERT OR REPLACE INTO cache (key, value, expires_at, created_at) VALUES (?, ?, ?, ?)",
-                    (key, value_json, expires_at, created_at)
+                    (key, value_bytes, expires_at, created_at)
                 )
                 await db.commit()
                 
@@ -230,7 +266,7 @@ class CacheService:
             try:
                 value = await self.redis_client.get(key)
                 if value is not None:
-                    return json.loads(value)
+                    return _loads(value)
             except Exception as e:
                 logger.debug(f"Redis get failed for {key}: {e}")
         
@@ -244,7 +280,7 @@ class CacheService:
                         await self.redis_client.setex(
                             key, 
                             settings.cache_ttl, 
-                            json.dumps(value)
+                            _dumps(value)
                         )
                     except Exception:
                         pass  # Ignore promotion failures
@@ -263,7 +299,7 @@ class CacheService:
         # Set in Redis if available
         if self.redis_client:
             try:
-                await self.redis_client.setex(key, ttl, json.dumps(value))
+                await self.redis_client.setex(key, ttl, _dumps(value))
             except Exception as e:
                 logger.debug(f"Redis set failed for {key}: {e}")
         
@@ -7,7 +7,7 @@ Ensures the application works in all environments with graceful degradation.
 import os
 import logging
 from typing import Optional, List
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field
 
 
@@ -72,10 +72,11 @@ class Settings(BaseSettings):
     # Data Directory
     data_dir: str = Field(default="./data", description="Data directory for local storage")
     
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = False
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=False
+    )
     
     @property
     def cors_origins_list(self) -> List[str]:
@@ -0,0 +1,84 @@
+"""msgspec decoders for high-volume NASA OSDR payloads.
+
+The OSDR search envelope is decoded straight from the response bytes into
+typed structs that declare only the `_source` keys the dataset transform
+reads, so the rest of each (large) study record is skipped during parsing
+instead of being materialized as Python objects. msgspec is optional;
+callers fall back to orjson when it is not installed.
+"""
+
+from typing import Any, Dict, List, Optional, Union
+
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    msgspec = None
+    MSGSPEC_AVAILABLE = False
+
+if MSGSPEC_AVAILABLE:
+    # Any value, or UNSET when the key is absent from the payload
+    _Field = Union[Any, msgspec.UnsetType]
+
+    class OSDRSource(msgspec.Struct):
+        """The `_source` fields used by NasaClient._transform_osdr_hit_to_dataset.
+        
+        Missing keys stay UNSET and are left out by to_builtins, while an
+        explicit null is kept, so `.get(key, default)` behaves as on the dict.
+        """
+        study_identifier: _Field = msgspec.field(default=msgspec.UNSET, name="Study Identifier")
+        project_identifier: _Field = msgspec.field(default=msgspec.UNSET, name="Project Identifier")
+        study_title: _Field = msgspec.field(default=msgspec.UNSET, name="Study Title")
+        project_title: _Field = msgspec.field(default=msgspec.UNSET, name="Project Title")
+        study_description: _Field = msgspec.field(default=msgspec.UNSET, name="Study Description")
+        project_description: _Field = msgspec.field(default=msgspec.UNSET, name="Project Description")
+        organism: _Field = msgspec.UNSET
+        material_type: _Field = msgspec.field(default=msgspec.UNSET, name="Material Type")
+        mission: _Field = msgspec.field(default=msgspec.UNSET, name="Mission")
+        study_release_date: _Field = msgspec.field(default=msgspec.UNSET, name="Study Public Release Date")
+        project_release_date: _Field = msgspec.field(default=msgspec.UNSET, name="Project Release Date")
+        assay_technology_type: _Field = msgspec.field(default=msgspec.UNSET, name="Study Assay Technology Type")
+        assay_technology_platform: _Field = msgspec.field(default=msgspec.UNSET, name="Study Assay Technology Platform")
+        assay_measurement_type: _Field = msgspec.field(default=msgspec.UNSET, name="Study Assay Measurement Type")
+        protocol_type: _Field = msgspec.field(default=msgspec.UNSET, name="Study Protocol Type")
+        publication_title: _Field = msgspec.field(default=msgspec.UNSET, name="Study Publication Title")
+        flight_program: _Field = msgspec.field(default=msgspec.UNSET, name="Flight Program")
+        space_program: _Field = msgspec.field(default=msgspec.UNSET, name="Space Program")
+        managing_center: _Field = msgspec.field(default=msgspec.UNSET, name="Managing NASA Center")
+        funding_agency: _Field = msgspec.field(default=msgspec.UNSET, name="Study Funding Agency")
+        accession: _Field = msgspec.field(default=msgspec.UNSET, name="Accession")
+        source_url: _Field = msgspec.field(default=msgspec.UNSET, name="Authoritative Source URL")
+
+    class OSDRHit(msgspec.Struct):
+        id: _Field = msgspec.field(default=msgspec.UNSET, name="_id")
+        source: Union[OSDRSource, msgspec.UnsetType] = msgspec.field(default=msgspec.UNSET, name="_source")
+
+    class OSDRHits(msgspec.Struct):
+        total: Any = 0
+        hits: List[OSDRHit] = []
+
+    class OSDRSearchEnvelope(msgspec.Struct):
+        hits: OSDRHits
+
+    _SEARCH_DECODER = msgspec.json.Decoder(OSDRSearchEnvelope)
+
+def decode_osdr_search(content: bytes) -> Optional[Dict[str, Any]]:
+    """Decode an OSDR Elasticsearch search response body.
+
+    Returns the `{"hits": {"total", "hits": [{"_id", "_source"}]}}` shape the
+    dataset transform expects, with each `_source` trimmed to the keys it
+    reads. Returns None when msgspec is unavailable or the body has a
+    different shape, so the caller can fall back to a generic JSON parse.
+    """
+    if not MSGSPEC_AVAILABLE:
+        return None
+    try:
+        envelope = _SEARCH_DECODER.decode(content)
+    except (msgspec.DecodeError, msgspec.ValidationError):
+        return None
+    return {
+        "hits": {
+            "total": envelope.hits.total,
+            "hits": [msgspec.to_builtins(hit) for hit in envelope.hits.hits],
+        }
+    }
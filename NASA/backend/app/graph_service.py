@@ -11,6 +11,7 @@ import aiosqlite
 import json
 import os
 import hashlib
+from collections import OrderedDict
 from datetime import datetime
 
 # Optional Neo4j import
@@ -21,6 +22,11 @@ except ImportError:
     NEO4J_AVAILABLE = False
     logger.warning("Neo4j driver not available, using SQLite fallback")
 
+# Background graph builds: pending batches beyond this are dropped, and the
+# last few built study-id sets are skipped when the same page is queued again
+GRAPH_QUEUE_SIZE = 32
+GRAPH_RECENT_BUILDS = 16
+
 class SQLiteGraph:
     """SQLite-based graph database for storing nodes and relationships."""
     
@@ -212,6 +218,38 @@ class SQLiteGraph:
             "edge_count": len(edges)
         }
     
+    async def get_graph_columns(self, limit: int = 100) -> Dict[str, Any]:
+        """Get graph data as parallel columns (struct-of-arrays), straight from the rows."""
+        if not self._initialized:
+            await self.init()
+        
+        try:
+            async with aiosqlite.connect(self.db_path) as db:
+                async with db.execute("SELECT id, label, type, properties FROM nodes LIMIT ?", (limit,)) as cursor:
+                    node_rows = await cursor.fetchall()
+                async with db.execute("SELECT id, source_id, target_id, label, properties FROM edges LIMIT ?", (limit,)) as cursor:
+                    edge_rows = await cursor.fetchall()
+        except Exception as e:
+            logger.error(f"Failed to get graph columns: {e}")
+            node_rows, edge_rows = [], []
+        
+        node_ids, node_labels, node_types, node_props = (list(col) for col in zip(*node_rows)) if node_rows else ([], [], [], [])
+        edge_ids, edge_sources, edge_targets, edge_labels, edge_props = (list(col) for col in zip(*edge_rows)) if edge_rows else ([], [], [], [], [])
+        
+        return {
+            "node_ids": node_ids,
+            "node_labels": node_labels,
+            "node_types": node_types,
+            "node_properties": [json.loads(p) if p else {} for p in node_props],
+            "edge_ids": edge_ids,
+            "edge_sources": edge_sources,
+            "edge_targets": edge_targets,
+            "edge_labels": edge_labels,
+            "edge_properties": [json.loads(p) if p else {} for p in edge_props],
+            "node_count": len(node_ids),
+            "edge_count": len(edge_ids)
+        }
+    
     async def search_nodes(self, query: str, limit: int = 50) -> List[Dict[str, Any]]:
         """Search nodes by label or properties."""
         if not self._initialized:
@@ -271,6 +309,11 @@ class GraphService:
         # Initialize with NASA data structure
         self._setup_graph_structure()
         
+        # Single consumer for build requests, started in init()
+        self._build_queue: asyncio.Queue = asyncio.Queue(maxsize=GRAPH_QUEUE_SIZE)
+        self._recent_builds: "OrderedDict[frozenset, None]" = OrderedDict()
+        self._build_worker: Optional[asyncio.Task] = None
+        
         logger.info(f"Graph service configured:")
         logger.info(f"  - Neo4j: {'✓' if self.neo4j_driver else '✗'}")
         logger.info(f"  - SQLite: ✓ (at {sqlite_path})")
@@ -305,6 +348,36 @@ class GraphService:
                 logger.info("Graph is empty - will be populated from NASA OSDR datasets")
         except Exception as e:
             logger.error(f"Failed to check graph data: {e}")
+        
+        self._build_worker = asyncio.create_task(self._graph_worker())
+    
+    def enqueue_build(self, studies: List[Dict[str, Any]]) -> bool:
+        """Queue studies for a background graph build; returns False if the queue is full."""
+        try:
+            self._build_queue.put_nowait(studies)
+            return True
+        except asyncio.QueueFull:
+            logger.debug(f"Graph build queue full, dropping batch of {len(studies)} studies")
+            return False
+    
+    async def _graph_worker(self):
+        """Drain the build queue one batch at a time, skipping recently built study sets."""
+        while True:
+            studies = await self._build_queue.get()
+            try:
+                ids = frozenset(study.get('id') or study.get('study_id') for study in studies)
+                if ids in self._recent_builds:
+                    self._recent_builds.move_to_end(ids)
+                    continue
+                
+                if await self.build_graph_from_data(studies):
+                    self._recent_builds[ids] = None
+                    if len(self._recent_builds) > GRAPH_RECENT_BUILDS:
+                        self._recent_builds.popitem(last=False)
+            except Exception as e:
+                logger.error(f"Background graph build failed: {e}")
+            finally:
+                self._build_queue.task_done()
     
     async def add_study_node(self, study_id: str, study_data: Dict[str, Any]) -> bool:
         """Add a study node to the knowledge graph."""
@@ -494,6 +567,18 @@ class GraphService:
             logger.error(f"Failed to create sample graph: {e}")
             return False
     
+    @staticmethod
+    def _neo4j_properties(entity) -> Dict[str, Any]:
+        """Properties of a Neo4j node/relationship, with the JSON `properties` blob studies are written with unpacked."""
+        properties = dict(entity)
+        stored = properties.pop("properties", None)
+        if isinstance(stored, str):
+            try:
+                properties.update(json.loads(stored))
+            except ValueError:
+                properties["properties"] = stored
+        return properties
+    
     async def get_graph(self, limit: int = 100) -> Dict[str, Any]:
         """Get graph data for visualization."""
         # Try Neo4j first
@@ -523,7 +608,8 @@ class GraphService:
                                 nodes[node_id] = {
                                     "id": node_id,
                                     "label": node.get("label", node.get("name", node_id)),
-                                    "type": list(node.labels)[0].lower() if node.labels else "unknown"
+                                    "type": list(node.labels)[0].lower() if node.labels else "unknown",
+                                    "properties": self._neo4j_properties(node)
                                 }
                         
                         # Add edge
@@ -531,7 +617,8 @@ class GraphService:
                             "id": str(r.id),
                             "source": str(n.id),
                             "target": str(m.id),
-                            "label": r.type.lower().replace('_', ' ')
+                            "label": r.type.lower().replace('_', ' '),
+                            "properties": self._neo4j_properties(r)
                         })
                     
                     return {
@@ -548,6 +635,33 @@ class GraphService:
         graph_data["provider"] = "sqlite"
         return graph_data
     
+    async def get_graph_columns(self, limit: int = 100) -> Dict[str, Any]:
+        """Get graph data as parallel columns (struct-of-arrays) for GraphResponseSoA."""
+        if self.neo4j_driver:
+            graph_data = await self.get_graph(limit=limit)
+            if graph_data.get("provider") == "neo4j":
+                nodes = graph_data["nodes"]
+                edges = graph_data["edges"]
+                return {
+                    "node_ids": [n["id"] for n in nodes],
+                    "node_labels": [n["label"] for n in nodes],
+                    "node_types": [n["type"] for n in nodes],
+                    "node_properties": [n["properties"] for n in nodes],
+                    "edge_ids": [e["id"] for e in edges],
+                    "edge_sources": [e["source"] for e in edges],
+                    "edge_targets": [e["target"] for e in edges],
+                    "edge_labels": [e["label"] for e in edges],
+                    "edge_properties": [e["properties"] for e in edges],
+                    "node_count": len(nodes),
+                    "edge_count": len(edges),
+                    "provider": "neo4j"
+                }
+        
+        # SQLite rows map onto the columns directly
+        columns = await self.sqlite_graph.get_graph_columns(limit)
+        columns["provider"] = "sqlite"
+        return columns
+    
     async def search_graph(self, query: str, limit: int = 50) -> Dict[str, Any]:
         """Search the knowledge graph."""
         # Try Neo4j first
@@ -648,7 +762,12 @@ class GraphService:
         return stats
     
     async def close(self):
-        """Close graph service connections."""
+        """Stop the build worker and close graph service connections."""
+        if self._build_worker:
+            self._build_worker.cancel()
+            await asyncio.gather(self._build_worker, return_exceptions=True)
+            self._build_worker = None
+        
         if self.neo4j_driver:
             try:
                 await self.neo4j_driver.close()
@@ -0,0 +1,53 @@
+"""Internal Pydantic models for NASA Space Biology Knowledge Engine.
+
+Lean models used inside the backend (graph traversal and assembly). They
+carry no Field metadata so their core schemas stay small; public request
+and response models with OpenAPI descriptions live in schemas.py.
+"""
+
+from pydantic import BaseModel, ConfigDict, Field, field_serializer, field_validator
+from types import MappingProxyType
+from typing import Any, Mapping
+
+# Read-only empty mapping shared by every node/edge without properties
+_EMPTY_PROPERTIES: Mapping[str, Any] = MappingProxyType({})
+
+def _empty_properties() -> Mapping[str, Any]:
+    return _EMPTY_PROPERTIES
+
+class GraphNode(BaseModel):
+    """Knowledge graph node (study, organism, mission, etc.)."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
+    id: str
+    label: str
+    type: str
+    properties: Mapping[str, Any] = Field(default_factory=_empty_properties)
+    
+    @field_validator("properties", mode="wrap")
+    @classmethod
+    def _empty_as_shared(cls, v, handler):
+        return handler(v) if v else _EMPTY_PROPERTIES
+    
+    @field_serializer("properties")
+    def _properties_as_dict(self, v: Mapping[str, Any]):
+        return v if isinstance(v, dict) else dict(v)
+
+class GraphEdge(BaseModel):
+    """Knowledge graph edge between two node IDs."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
+    id: str
+    source: str
+    target: str
+    label: str
+    properties: Mapping[str, Any] = Field(default_factory=_empty_properties)
+    
+    @field_validator("properties", mode="wrap")
+    @classmethod
+    def _empty_as_shared(cls, v, handler):
+        return handler(v) if v else _EMPTY_PROPERTIES
+    
+    @field_serializer("properties")
+    def _properties_as_dict(self, v: Mapping[str, Any]):
+        return v if isinstance(v, dict) else dict(v)
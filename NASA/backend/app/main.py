@@ -4,6 +4,7 @@ NEXUS: NASA Space Biology Knowledge Engine
 A production-ready web platform for exploring NASA space biology data.
 """
 
+import httpx
 import uvicorn
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
@@ -15,6 +16,7 @@ from .cache import CacheService
 from .graph_service import GraphService
 from .routes import router
 import asyncio
+from types import SimpleNamespace
 
 # Global service instances
 nasa_client: NASAClient = None
@@ -31,7 +33,6 @@ async def lifespan(app: FastAPI):
     global nasa_client, ai_service, cache_service, graph_service
     
     # Initialize services
-    nasa_client = NASAClient()
     ai_service = AIService()
     cache_service = CacheService()
     graph_service = GraphService()
@@ -40,6 +41,15 @@ async def lifespan(app: FastAPI):
     await cache_service.init()
     logger.info("Cache service initialized")
     
+    # NASA client shares the Redis connection (if any) for its response cache
+    nasa_client = NASAClient(redis=cache_service.redis_client)
+    
+    # The gather()-based fan-outs in the routes rely on one pooled, keep-alive client
+    if not isinstance(nasa_client.client, httpx.AsyncClient):
+        raise RuntimeError("NASA client must use a shared httpx.AsyncClient")
+    if not nasa_client.http2:
+        logger.warning("HTTP/2 unavailable (install h2) - NASA fan-outs fall back to the HTTP/1.1 keep-alive pool")
+    
     # Initialize graph service
     await graph_service.init()
     logger.info("Graph service initialized")
@@ -49,6 +59,13 @@ async def lifespan(app: FastAPI):
     app.state.ai_service = ai_service
     app.state.cache_service = cache_service
     app.state.graph_service = graph_service
+    # Built once so the per-request get_services dependency is a single attribute read
+    app.state.services = SimpleNamespace(
+        nasa_client=nasa_client,
+        ai_service=ai_service,
+        cache_service=cache_service,
+        graph_service=graph_service
+    )
     
     logger.info("All services initialized successfully")
     
@@ -4,15 +4,233 @@ Provides access to all NASA Open Science Data Repository (OSDR) endpoints
 with proper authentication, error handling, and graceful fallbacks.
 """
 
+import asyncio
+import hashlib
 import httpx
-from typing import Optional, Any, Dict, List
+from collections import Counter, OrderedDict
+import orjson
+from typing import Optional, Any, Awaitable, Callable, Dict, List, Set, Tuple
 from .config import settings, logger
+from .cache import InMemoryCache, SingleFlight, SQLiteCache
+from .fast_schemas import decode_osdr_search
+from .schemas_util import first_value
 import json
+import os
+import random
+import time
+
+# Brotli decoding is only available when httpx's brotli extra is installed
+try:
+    import brotli  # noqa: F401
+    BROTLI_AVAILABLE = True
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        BROTLI_AVAILABLE = True
+    except ImportError:
+        BROTLI_AVAILABLE = False
+
+# HTTP/2 needs the h2 package (httpx[http2]); fall back to pooled HTTP/1.1 without it
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Incremental JSON parsing for large all_files listings (optional)
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Idempotent GETs are retried on transient upstream failures with jittered backoff
+RETRY_ATTEMPTS = 3
+RETRY_STATUSES = frozenset({502, 503, 504})
+RETRY_BASE_DELAY = 0.2
+RETRY_MAX_DELAY = 2.0
+
+# Stale copies outlive the fresh entry so they can be served while OSDR is down
+STALE_TTL = 7 * 86400
+# Reference lists (organisms, missions, GEODE catalogues) change slowly upstream
+REFERENCE_TTL = 900
+# Study metadata and file listings rarely change; persisted across restarts
+DISK_TTL = 86400
+# Study details; studies with no public metadata are re-checked sooner
+DETAILS_TTL = 600
+DETAILS_EMPTY_TTL = 60
+# Transformed OSDR hits memoized by a hash of the hit's content (LRU), so an unchanged
+# study skips the transform across details refetches and an edited one misses
+TRANSFORM_CACHE_SIZE = 2048
+
+# Placeholder values that don't name a real organism/mission
+_BAD_ORGANISMS = frozenset({'Unknown', ''})
+_BAD_MISSIONS = frozenset({'Unknown', 'Unknown Mission', ''})
+
+# DEPRECATED sample data, kept only for _get_sample_datasets; built once at import
+_SAMPLE_DATASETS: Tuple[Dict[str, Any], ...] = (
+    {
+        "id": "GLDS-104",
+        "title": "Spaceflight Effects on Arabidopsis Gene Expression",
+        "description": "Analysis of Arabidopsis thaliana grown aboard the International Space Station to understand how spaceflight affects plant gene expression and development. This study examines transcriptomic changes in plant tissues exposed to microgravity.",
+        "organism": "Arabidopsis thaliana",
+        "mission": "SpaceX CRS-3",
+        "data_types": ["RNA-seq", "Microarray"],
+        "release_date": "2023-08-15",
+        "study_type": "Transcriptome",
+        "publications": 3,
+        "samples": 24
+    },
+    {
+        "id": "GLDS-242",
+        "title": "Microgravity-Induced Changes in Mouse Muscle",
+        "description": "Investigation of muscle atrophy and protein degradation pathways in mice exposed to microgravity conditions during long-duration spaceflight missions. Focuses on skeletal muscle adaptations.",
+        "organism": "Mus musculus",
+        "mission": "SpaceX CRS-18",
+        "data_types": ["Proteome", "Western Blot"],
+        "release_date": "2023-09-22",
+        "study_type": "Proteome",
+        "publications": 7,
+        "samples": 48
+    },
+    {
+        "id": "GLDS-321",
+        "title": "Radiation Response in Human Cell Cultures",
+        "description": "Study of DNA repair mechanisms and cellular stress responses in human fibroblast cultures exposed to space radiation levels. Examines genomic stability and repair pathway activation.",
+        "organism": "Homo sapiens",
+        "mission": "ISS Expedition 65",
+        "data_types": ["RNA-seq", "ChIP-seq", "ATAC-seq"],
+        "release_date": "2023-11-10",
+        "study_type": "Multi-omics",
+        "publications": 5,
+        "samples": 36
+    },
+    {
+        "id": "GLDS-158",
+        "title": "Fruit Fly Circadian Rhythms in Space",
+        "description": "Analysis of circadian clock disruption in Drosophila melanogaster during spaceflight. Investigates changes in sleep-wake cycles and clock gene expression patterns in microgravity.",
+        "organism": "Drosophila melanogaster",
+        "mission": "SpaceX CRS-12",
+        "data_types": ["RNA-seq", "Behavioral Analysis"],
+        "release_date": "2023-07-30",
+        "study_type": "Behavioral Genomics",
+        "publications": 4,
+        "samples": 72
+    },
+    {
+        "id": "GLDS-275",
+        "title": "Bone Density Loss in Rat Models",
+        "description": "Comprehensive analysis of bone mineral density changes and osteoblast activity in rats during extended exposure to microgravity conditions. Studies calcium metabolism and bone formation.",
+        "organism": "Rattus norvegicus",
+        "mission": "SpaceX CRS-21",
+        "data_types": ["MicroCT", "Histology", "qPCR"],
+        "release_date": "2023-10-05",
+        "study_type": "Physiology",
+        "publications": 6,
+        "samples": 60
+    },
+    {
+        "id": "GLDS-199",
+        "title": "Microbial Community Changes in Space",
+        "description": "Metagenomic analysis of microbial communities aboard the International Space Station. Examines how microgravity and radiation affect bacterial growth patterns and antibiotic resistance.",
+        "organism": "Escherichia coli",
+        "mission": "ISS Expedition 63",
+        "data_types": ["16S rRNA", "Metagenomics"],
+        "release_date": "2023-06-18",
+        "study_type": "Microbiome",
+        "publications": 8,
+        "samples": 144
+    },
+    {
+        "id": "GLDS-87",
+        "title": "Yeast Cell Cycle in Microgravity",
+        "description": "Investigation of cell division and cell cycle regulation in Saccharomyces cerevisiae under microgravity conditions. Studies cell wall formation and budding patterns.",
+        "organism": "Saccharomyces cerevisiae",
+        "mission": "SpaceX CRS-8",
+        "data_types": ["RNA-seq", "Flow Cytometry"],
+        "release_date": "2023-05-12",
+        "study_type": "Cell Biology",
+        "publications": 2,
+        "samples": 18
+    },
+    {
+        "id": "GLDS-312",
+        "title": "Nematode Aging in Space Environment",
+        "description": "Long-term study of aging processes and lifespan in C. elegans exposed to spaceflight conditions. Examines oxidative stress responses and longevity gene expression.",
+        "organism": "Caenorhabditis elegans",
+        "mission": "SpaceX CRS-24",
+        "data_types": ["RNA-seq", "Lifespan Analysis"],
+        "release_date": "2024-01-08",
+        "study_type": "Aging Research",
+        "publications": 3,
+        "samples": 96
+    }
+)
+
+def _shallow_copy(data: Any) -> Any:
+    """Copy a cached payload's top level so callers can't add/replace keys in the cache."""
+    if isinstance(data, dict):
+        return dict(data)
+    if isinstance(data, list):
+        return list(data)
+    return data
+
+class _AsyncByteReader:
+    """Async file-like wrapper so ijson can consume an httpx byte stream.
+    
+    read(size) honours size (read(0) is ijson's type probe and must not
+    consume data). Bytes received are also kept in `body` so the caller can
+    fall back to a buffered parse without requesting the body again, until
+    the caller sets `body` to None once it no longer needs that fallback.
+    """
+    
+    def __init__(self, response: httpx.Response):
+        self._chunks = response.aiter_bytes()
+        self._buffer = bytearray()
+        self._eof = False
+        self.body: Optional[bytearray] = bytearray()
+
+    async def read(self, size: int = -1) -> bytes:
+        if size == 0:
+            return b""
+        while not self._eof and (size < 0 or len(self._buffer) < size):
+            try:
+                chunk = await self._chunks.__anext__()
+            except StopAsyncIteration:
+                self._eof = True
+                break
+            self._buffer += chunk
+            if self.body is not None:
+                self.body += chunk
+        if size < 0:
+            size = len(self._buffer)
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
 
 class NASAClient:
     """Client for interacting with NASA OSDR and GEODE APIs."""
     
-    def __init__(self, client: Optional[httpx.AsyncClient] = None):
+    # Output field -> source keys tried in order, for the two files API response shapes
+    _FILE_ALIASES = (
+        ("file_name", ("file_name", "name", "filename")),
+        ("file_size", ("file_size", "size")),
+        ("file_type", ("file_type", "type")),
+        ("file_url", ("file_url", "url", "download_url")),
+        ("remote_url", ("remote_url",)),
+        ("subdirectory", ("subdirectory", "path")),
+        ("description", ("description",))
+    )
+    _FILE_LIST_ALIASES = (
+        ("file_name", ("file_name", "name")),
+        ("file_size", ("file_size", "size")),
+        ("file_type", ("file_type", "type")),
+        ("file_url", ("file_url", "url")),
+        ("remote_url", ("remote_url",)),
+        ("subdirectory", ("subdirectory",))
+    )
+    
+    def __init__(self, client: Optional[httpx.AsyncClient] = None, redis: Optional[Any] = None):
         self.osdr_base = settings.nasa_osdr_base_url.rstrip("/")
         self.geode_base = settings.nasa_geode_base_url.rstrip("/")
         self.api_base = settings.nasa_api_base_url.rstrip("/")
@@ -23,6 +241,7 @@ class NASAClient:
         headers = {
             "User-Agent": "NEXUS-NASA-Space-Biology-Knowledge-Engine/1.0",
             "Accept": "application/json",
+            "Accept-Encoding": "gzip, deflate, br" if BROTLI_AVAILABLE else "gzip, deflate",
             "Content-Type": "application/json"
         }
         
@@ -36,66 +255,245 @@ class NASAClient:
         else:
             self.api_key_param = {}
         
+        # Large keep-alive pool (and HTTP/2 multiplexing when available) so concurrent
+        # study/file/metadata fan-outs reuse connections instead of re-handshaking.
+        # Passed to the client rather than a custom transport so HTTP(S)_PROXY/NO_PROXY
+        # still apply; connection failures are retried in _get.
+        self.http2 = HTTP2_AVAILABLE
         self.client = client or httpx.AsyncClient(
             timeout=30.0,
             headers=headers,
-            follow_redirects=True
+            follow_redirects=True,
+            http2=self.http2,
+            limits=httpx.Limits(
+                max_keepalive_connections=50,
+                max_connections=100,
+                keepalive_expiry=30.0
+            )
         )
         
-        logger.info(f"NASA Client initialized:")
-        logger.info(f"  - OSDR Base: {self.osdr_base}")
-        logger.info(f"  - GEODE Base: {self.geode_base}")
-        logger.info(f"  - API Base: {self.api_base}")
-        logger.info(f"  - GeneLab Base: {self.genelab_base}")
-        logger.info(f"  - API Key: {'✓' if self.api_key else '✗'}")
-
-    async def get_datasets(self, limit: int = 50, page: int = 0, with_files: bool = False) -> Dict[str, Any]:
-        """Get latest studies/datasets from OSDR with pagination."""
-        # NASA OSDR Bio Repo API - Returns genuine space biology studies with complete data
-        endpoints_to_try = [
+        # Endpoint templates, built once; per-request paging/query params are merged in
+        search_url = self._search_url = f"{self.osdr_base}/osdr/data/search"
+        self._datasets_endpoints = [
             # Endpoint 1: Bio Repo Search with data sources (PRIMARY - has everything)
-            {
-                "url": f"{self.osdr_base}/bio/repo/search",
-                "params": {
-                    "q": "",
-                    "data_source": "cgene,alsda,esa",
-                    "data_type": "study",
-                    "size": min(limit * 10, 500),  # Fetch 10x more to filter for genuine studies
-                    "from": page * limit
-                }
-            },
+            (f"{self.osdr_base}/bio/repo/search", {"q": "", "data_source": "cgene,alsda,esa", "data_type": "study"}),
             # Endpoint 2: OSDR data search with data sources (FALLBACK)
-            {
-                "url": f"{self.osdr_base}/osdr/data/search",
-                "params": {
-                    "size": min(limit * 10, 500),  # Fetch 10x more to filter
-                    "from": page * limit,
-                    "data_source": "cgene,alsda"
-                }
-            },
+            (search_url, {"data_source": "cgene,alsda"}),
             # Endpoint 3: OSDR general search (LAST RESORT - fetch even more to filter)
-            {
-                "url": f"{self.osdr_base}/osdr/data/search",
-                "params": {
-                    "size": min(limit * 10, 500),  # Fetch 10x more to filter
-                    "from": page * limit
-                }
-            }
+            (search_url, {})
+        ]
+        # "q" holds a prefix that the caller's query is appended to
+        self._search_endpoints = [
+            # OSDR Search API - Primary search endpoint (working!)
+            (search_url, {"format": "json"}),
+            # OSDR Search API - With query parameter
+            (search_url, {"format": "json", "q": ""}),
+            # OSDR Search API - With API key
+            (search_url, {"format": "json", "q": "", **self.api_key_param}),
+            # OSDR Search API - Biology specific
+            (search_url, {"format": "json", "q": "biology "}),
+            # OSDR Search API - Space biology specific
+            (search_url, {"format": "json", "q": "space biology "})
         ]
+        geode_api = f"{self.geode_base}/geode-py/ws/api"
+        self._url_experiments = f"{geode_api}/experiments"
+        self._url_payloads = f"{geode_api}/payloads"
+        self._url_hardware = f"{geode_api}/hardware"
+        self._url_vehicles = f"{geode_api}/vehicles"
+        self._url_biospecimens = f"{geode_api}/biospecimens"
+        self._meta_url_tpl = (self.osdr_base + "/osdr/data/osd/meta/{}").format
+        self._files_url_tpl = (self.osdr_base + "/osdr/data/osd/files/{}").format
+        
+        # Response cache: in-process L1 backed by an optional Redis tier shared
+        # across worker processes (keys are identical in every worker)
+        self.redis = redis
+        self._memory_cache = InMemoryCache(max_size=settings.max_cache_size)
+        # Identical concurrent per-study fetches share one upstream request
+        self._inflight = SingleFlight()
+        # Assembled study details, so repeat views skip both search and metadata calls
+        self._details_cache = InMemoryCache(max_size=1024)
+        # Transformed search hits for recently viewed studies
+        self._transform_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+        # Persistent per-study cache shared by restarts and workers on this host
+        self._disk = SQLiteCache(os.path.join(settings.data_dir, "osdr_cache.db"))
+        
+        logger.info("NASA Client initialized:")
+        logger.info("  - OSDR Base: %s", self.osdr_base)
+        logger.info("  - GEODE Base: %s", self.geode_base)
+        logger.info("  - API Base: %s", self.api_base)
+        logger.info("  - GeneLab Base: %s", self.genelab_base)
+        logger.info("  - API Key: %s", '✓' if self.api_key else '✗')
+        logger.info("  - HTTP/2: %s", '✓' if self.http2 else '✗')
+        logger.info("  - Shared Redis cache: %s", '✓' if self.redis else '✗')
+        
+        # Resolve DNS and open TLS sessions to both hosts before the first user request
+        self._closed = False
+        self._bg_tasks: Set[asyncio.Task] = set()
+        if client is None:
+            try:
+                task = asyncio.get_running_loop().create_task(self._warmup())
+                self._bg_tasks.add(task)
+                task.add_done_callback(self._bg_tasks.discard)
+            except RuntimeError:
+                logger.debug("No running event loop - skipping NASA connection warmup")
+
+    async def _warmup(self):
+        """Fire cheap HEAD requests so the connection pool holds warm OSDR/GEODE connections."""
+        results = await asyncio.gather(
+            self.client.head(self._search_url),
+            self.client.head(self._url_experiments),
+            return_exceptions=True
+        )
+        warmed = sum(1 for result in results if not isinstance(result, Exception))
+        logger.info("NASA client warmup: %s/%s hosts reachable", warmed, len(results))
+
+    @staticmethod
+    def _json(response: httpx.Response) -> Any:
+        """Decode a JSON response body straight from bytes with orjson."""
+        return orjson.loads(response.content)
+
+    @staticmethod
+    async def _backoff(attempt: int) -> None:
+        """Sleep before retry number `attempt` + 1 (exponential, jittered)."""
+        delay = min(RETRY_BASE_DELAY * 2 ** (attempt - 1), RETRY_MAX_DELAY)
+        await asyncio.sleep(delay + random.uniform(0, RETRY_BASE_DELAY))
+
+    async def _get(self, url: str, **kwargs) -> httpx.Response:
+        """GET with exponential backoff on transport errors and 502/503/504 responses."""
+        for attempt in range(1, RETRY_ATTEMPTS + 1):
+            try:
+                response = await self.client.get(url, **kwargs)
+                if response.status_code not in RETRY_STATUSES or attempt == RETRY_ATTEMPTS:
+                    return response
+                logger.warning("%s returned %s (attempt %s/%s), retrying", url, response.status_code, attempt, RETRY_ATTEMPTS)
+            except httpx.TransportError as e:
+                if attempt == RETRY_ATTEMPTS:
+                    raise
+                logger.warning("%s failed: %s (attempt %s/%s), retrying", url, e, attempt, RETRY_ATTEMPTS)
+            
+            await self._backoff(attempt)
+
+    async def _get_json(self, url: str, **kwargs) -> Any:
+        """GET with retries, raising for error statuses, and return the decoded JSON body."""
+        response = await self._get(url, **kwargs)
+        response.raise_for_status()
+        return self._json(response)
+
+    async def _cached_get(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Dict[str, Any]]],
+        ttl: int,
+    ) -> Dict[str, Any]:
+        """Serve from the in-process cache, then Redis, then the network.
+        
+        Only successful responses are cached. A long-lived stale copy is kept in
+        Redis so callers can fall back to it when OSDR is unavailable.
+        
+        Entries are held decoded; each caller gets a shallow copy, so handlers
+        may add or replace top-level keys but must not mutate nested values.
+        """
+        cached = await self._memory_cache.get(key)
+        if cached is not None:
+            return _shallow_copy(cached)
+        
+        if self.redis:
+            try:
+                value = await self.redis.get(key)
+                if value is not None:
+                    data = orjson.loads(value)
+                    await self._memory_cache.set(key, data, ttl)
+                    return _shallow_copy(data)
+            except Exception as e:
+                logger.debug("Redis get failed for %s: %s", key, e)
         
-        logger.info(f"=" * 80)
-        logger.info(f"ATTEMPTING NASA OSDR API CALL")
-        logger.info(f"Trying {len(endpoints_to_try)} endpoint variations")
-        logger.info(f"API Key configured: {bool(self.api_key)}")
-        logger.info(f"=" * 80)
+        data = await fetch()
+        if isinstance(data, dict) and "error" in data:
+            return data
         
-        for idx, endpoint_config in enumerate(endpoints_to_try):
-            url = endpoint_config["url"]
-            params = endpoint_config["params"]
+        await self._memory_cache.set(key, data, ttl)
+        if self.redis:
+            try:
+                payload = orjson.dumps(data)
+                await self.redis.setex(key, ttl, payload)
+                await self.redis.setex(f"{key}:stale", STALE_TTL, payload)
+            except Exception as e:
+                logger.debug("Redis set failed for %s: %s", key, e)
+        return _shallow_copy(data)
+
+    async def _get_stale(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the last successfully cached response for a key, if any."""
+        if not self.redis:
+            return None
+        try:
+            value = await self.redis.get(f"{key}:stale")
+            return orjson.loads(value) if value is not None else None
+        except Exception as e:
+            logger.debug("Redis stale lookup failed for %s: %s", key, e)
+            return None
+
+    async def _disk_get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a payload from the persistent cache, unwrapping its envelope."""
+        try:
+            envelope = await self._disk.get(key)
+        except Exception as e:
+            logger.debug("Disk cache get failed for %s: %s", key, e)
+            return None
+        return envelope["data"] if envelope else None
+
+    async def _disk_set(self, key: str, data: Dict[str, Any], source_version: Optional[str] = None):
+        """Persist a payload with metadata about when and from what it was cached."""
+        envelope = {
+            "cached_at": time.time(),
+            "source_version": source_version,
+            "data": data
+        }
+        try:
+            await self._disk.set(key, envelope, ttl=DISK_TTL)
+        except Exception as e:
+            logger.debug("Disk cache set failed for %s: %s", key, e)
+
+    async def get_datasets(self, limit: int = 50, page: int = 0, with_files: bool = False) -> Dict[str, Any]:
+        """Get latest studies/datasets from OSDR with pagination.
+        
+        Falls back to the last good cached page (flagged ``stale``) when every
+        OSDR endpoint fails.
+        """
+        key = f"nasa:datasets:{limit}:{page}:{int(with_files)}"
+        data = await self._cached_get(
+            key,
+            lambda: self._fetch_datasets(limit, page, with_files),
+            ttl=settings.cache_ttl
+        )
+        
+        if "error" in data:
+            stale = await self._get_stale(key)
+            if stale is not None:
+                logger.warning("Serving stale datasets for page %s - NASA OSDR unavailable", page)
+                return {**stale, "source": "NASA OSDR (stale)", "stale": True}
+        return data
+
+    async def _fetch_datasets(self, limit: int, page: int, with_files: bool) -> Dict[str, Any]:
+        """Fetch a page of studies/datasets from OSDR, trying each endpoint in turn."""
+        # NASA OSDR Bio Repo API - Returns genuine space biology studies with complete data
+        endpoints_to_try = self._datasets_endpoints
+        paging = {
+            "size": min(limit * 10, 500),  # Fetch 10x more to filter for genuine studies
+            "from": page * limit
+        }
+        
+        logger.info("=" * 80)
+        logger.info("ATTEMPTING NASA OSDR API CALL")
+        logger.info("Trying %s endpoint variations", len(endpoints_to_try))
+        logger.info("API Key configured: %s", bool(self.api_key))
+        logger.info("=" * 80)
+        
+        for idx, (url, base_params) in enumerate(endpoints_to_try):
+            params = {**base_params, **paging}
             
-            logger.info(f"\nAttempt {idx + 1}/{len(endpoints_to_try)}:")
-            logger.info(f"  URL: {url}")
-            logger.info(f"  Params: {params}")
+            logger.info("\nAttempt %s/%s:", idx + 1, len(endpoints_to_try))
+            logger.info("  URL: %s", url)
+            logger.info("  Params: %s", params)
             
             try:
                 # Make request with proper timeout
@@ -103,18 +501,21 @@ class NASAClient:
                 
                 if response.status_code == 200:
                     try:
-                        data = response.json()
+                        # Typed decode of the Elasticsearch envelope; other shapes go through orjson
+                        data = decode_osdr_search(response.content)
+                        if data is None:
+                            data = self._json(response)
                     except Exception as json_error:
-                        logger.warning(f"  ❌ JSON parse error: {json_error}")
-                        logger.warning(f"  Response text: {response.text[:200]}")
+                        logger.warning("  ❌ JSON parse error: %s", json_error)
+                        logger.warning("  Response text: %s", response.text[:200])
                         continue
                     
-                    logger.info(f"  ✅ Status 200 - Success!")
-                    logger.info(f"  Response keys: {list(data.keys()) if isinstance(data, dict) else 'not a dict'}")
+                    logger.info("  ✅ Status 200 - Success!")
+                    logger.info("  Response keys: %s", list(data.keys()) if isinstance(data, dict) else 'not a dict')
                     
                     # Skip if empty response
                     if not data or (isinstance(data, dict) and not data.keys()):
-                        logger.warning(f"  ❌ Empty response, trying next endpoint...")
+                        logger.warning("  ❌ Empty response, trying next endpoint...")
                         continue
                     
                     datasets = []
@@ -131,7 +532,7 @@ class NASAClient:
                         
                         if 'hits' in hits_data and isinstance(hits_data['hits'], list):
                             hits = hits_data['hits']
-                            logger.info(f"  ✅ Found {len(hits)} hits out of {total:,} total in OSDR!")
+                            logger.info("  ✅ Found %s hits out of %s total in OSDR!", len(hits), total)
                             
                             for hit in hits:
                                 dataset = self._transform_osdr_hit_to_dataset(hit)
@@ -144,15 +545,15 @@ class NASAClient:
                                     dataset_id = dataset.get('id', '')
                                     if dataset_id.startswith('OSD-') or dataset_id.startswith('GLDS-') or dataset_id.startswith('GLDS_'):
                                         datasets.append(dataset)
-                                        logger.info(f"     ✅ {dataset.get('id')}: {dataset.get('title', 'No title')[:60]}")
+                                        logger.info("     ✅ %s: %s", dataset.get('id'), dataset.get('title', 'No title')[:60])
                                     else:
-                                        logger.debug(f"     ⏭️  Skipped non-NASA study: {dataset_id}")
+                                        logger.debug("     ⏭️  Skipped non-NASA study: %s", dataset_id)
                                 else:
-                                    logger.warning(f"     ❌ Skipped null dataset from hit: {hit.get('_id', 'unknown')}")
+                                    logger.warning("     ❌ Skipped null dataset from hit: %s", hit.get('_id', 'unknown'))
                     
                     elif 'hits' in data and isinstance(data['hits'], list):
                         hits = data['hits']
-                        logger.info(f"  ✅ Found {len(hits)} hits in direct list format")
+                        logger.info("  ✅ Found %s hits in direct list format", len(hits))
                         
                         for hit in hits:
                             dataset = self._transform_hit_to_dataset(hit)
@@ -164,7 +565,7 @@ class NASAClient:
                     
                     # Visualization API format (direct list of studies)
                     elif isinstance(data, list):
-                        logger.info(f"  ✅ Found {len(data)} studies in direct list format (Visualization API)")
+                        logger.info("  ✅ Found %s studies in direct list format (Visualization API)", len(data))
                         for study in data:
                             dataset = self._transform_visualization_study(study)
                             if dataset and dataset.get('id'):
@@ -176,7 +577,7 @@ class NASAClient:
                     # Studies key format
                     elif 'studies' in data and isinstance(data['studies'], list):
                         studies = data['studies']
-                        logger.info(f"  ✅ Found {len(studies)} studies in 'studies' key")
+                        logger.info("  ✅ Found %s studies in 'studies' key", len(studies))
                         for study in studies:
                             dataset = self._transform_visualization_study(study)
                             if dataset and dataset.get('id'):
@@ -201,11 +602,11 @@ class NASAClient:
                         # File filtering disabled - most NASA studies don't have public files via API
                         # Users can check files on individual dataset pages
                         if with_files:
-                            logger.warning(f"  ⚠️  File filtering requested but disabled (most studies have no API-accessible files)")
+                            logger.warning("  ⚠️  File filtering requested but disabled (most studies have no API-accessible files)")
                             # Don't filter - just return all datasets
                         
-                        logger.info(f"  ✅ SUCCESS! Fetched {len(datasets)} datasets from NASA OSDR")
-                        logger.info(f"  📊 Total available in OSDR: {total:,}")
+                        logger.info("  ✅ SUCCESS! Fetched %s datasets from NASA OSDR", len(datasets))
+                        logger.info("  📊 Total available in OSDR: %s", total)
                         return {
                             "data": datasets,
                             "total": total,
@@ -217,21 +618,21 @@ class NASAClient:
                             "filtered_for_files": with_files
                         }
                     else:
-                        logger.warning(f"  ⚠️  Endpoint {idx + 1} returned empty data, trying next...")
+                        logger.warning("  ⚠️  Endpoint %s returned empty data, trying next...", idx + 1)
                         continue  # Try next endpoint
                 else:
-                    logger.warning(f"  ❌ Status {response.status_code}, trying next endpoint...")
+                    logger.warning("  ❌ Status %s, trying next endpoint...", response.status_code)
                     continue  # Try next endpoint
                     
             except Exception as endpoint_error:
-                logger.warning(f"  ❌ Endpoint {idx + 1} failed: {endpoint_error}")
+                logger.warning("  ❌ Endpoint %s failed: %s", idx + 1, endpoint_error)
                 continue  # Try next endpoint
         
         # If all endpoints failed, return error (NO FALLBACK)
-        logger.error(f"=" * 80)
-        logger.error(f"ALL NASA OSDR API ENDPOINTS FAILED")
-        logger.error(f"Cannot fetch datasets - NASA API is unavailable")
-        logger.error(f"=" * 80)
+        logger.error("=" * 80)
+        logger.error("ALL NASA OSDR API ENDPOINTS FAILED")
+        logger.error("Cannot fetch datasets - NASA API is unavailable")
+        logger.error("=" * 80)
         
         # Return error response instead of fallback
         return {
@@ -418,54 +819,34 @@ class NASAClient:
             "data_source_url": source.get('Authoritative Source URL')
         }
 
+    def _transform_osdr_hit_cached(self, hit: Dict[str, Any]) -> Dict[str, Any]:
+        """Memoized _transform_osdr_hit_to_dataset keyed by a digest of the hit's content."""
+        try:
+            key = hashlib.blake2b(orjson.dumps(hit, option=orjson.OPT_SORT_KEYS), digest_size=16).digest()
+        except TypeError:
+            return self._transform_osdr_hit_to_dataset(hit)
+        
+        cached = self._transform_cache.get(key)
+        if cached is None:
+            cached = self._transform_osdr_hit_to_dataset(hit)
+            self._transform_cache[key] = cached
+            if len(self._transform_cache) > TRANSFORM_CACHE_SIZE:
+                self._transform_cache.popitem(last=False)
+        else:
+            self._transform_cache.move_to_end(key)
+        # Shallow copy so callers can't modify the memoized entry
+        return dict(cached)
+
     async def search_studies(self, filters: Dict[str, Any]) -> Dict[str, Any]:
         """Search studies using OSDR search API with flexible filtering."""
         try:
-            # Try OSDR search endpoints with correct parameters
-            search_endpoints = [
-                # OSDR Search API - Primary search endpoint (working!)
-                {
-                    "url": f"{self.osdr_base}/osdr/data/search",
-                    "params": {"format": "json"}
-                },
-                # OSDR Search API - With query parameter
-                {
-                    "url": f"{self.osdr_base}/osdr/data/search",
-                    "params": {
-                        "format": "json",
-                        "q": filters.get("query", "")
-                    }
-                },
-                # OSDR Search API - With API key
-                {
-                    "url": f"{self.osdr_base}/osdr/data/search",
-                    "params": {
-                        "format": "json",
-                        "q": filters.get("query", ""),
-                        **self.api_key_param
-                    }
-                },
-                # OSDR Search API - Biology specific
-                {
-                    "url": f"{self.osdr_base}/osdr/data/search",
-                    "params": {
-                        "format": "json",
-                        "q": f"biology {filters.get('query', '')}"
-                    }
-                },
-                # OSDR Search API - Space biology specific
-                {
-                    "url": f"{self.osdr_base}/osdr/data/search",
-                    "params": {
-                        "format": "json",
-                        "q": f"space biology {filters.get('query', '')}"
-                    }
-                }
-            ]
+            query = filters.get("query", "")
             
-            for i, endpoint in enumerate(search_endpoints):
+            for i, (url, base_params) in enumerate(self._search_endpoints):
                 try:
-                    params = endpoint["params"].copy()
+                    params = dict(base_params)
+                    if "q" in params:
+                        params["q"] = f"{params['q']}{query}"
                     
                     # Add search parameters
                     if "query" in filters and filters["query"]:
@@ -482,12 +863,12 @@ class NASAClient:
                     if "mission" in filters:
                         params["mission"] = filters["mission"]
                     
-                    logger.info(f"Searching with endpoint {i+1}: {endpoint['url']} with params: {params}")
-                    response = await self.client.get(endpoint['url'], params=params)
+                    logger.info("Searching with endpoint %s: %s with params: %s", i+1, url, params)
+                    response = await self.client.get(url, params=params)
                     
                     if response.status_code == 200:
-                        data = response.json()
-                        logger.info(f"Search endpoint {i+1} returned status 200")
+                        data = self._json(response)
+                        logger.info("Search endpoint %s returned status 200", i+1)
                         
                         # Try to extract results from different formats
                         results = []
@@ -497,7 +878,7 @@ class NASAClient:
                             hits_data = data['hits']
                             if 'hits' in hits_data and isinstance(hits_data['hits'], list):
                                 osdr_hits = hits_data['hits']
-                                logger.info(f"Found {len(osdr_hits)} OSDR search results")
+                                logger.info("Found %s OSDR search results", len(osdr_hits))
                                 results = [self._transform_osdr_hit_to_dataset(hit) for hit in osdr_hits]
                         elif 'hits' in data and isinstance(data['hits'], list):
                             results = data['hits']
@@ -510,7 +891,7 @@ class NASAClient:
                             results = data
                         
                         if results and len(results) > 0:
-                            logger.info(f"Search endpoint {i+1} returned {len(results)} results")
+                            logger.info("Search endpoint %s returned %s results", i+1, len(results))
                             return {
                                 "hits": results,
                                 "total": data.get('total', data.get('total_hits', len(results))),
@@ -518,21 +899,21 @@ class NASAClient:
                                 "message": f"Found {len(results)} results from NASA search"
                             }
                         else:
-                            logger.warning(f"Search endpoint {i+1} returned empty results, trying next")
+                            logger.warning("Search endpoint %s returned empty results, trying next", i+1)
                             continue
                     else:
-                        logger.warning(f"Search endpoint {i+1} returned status {response.status_code}")
+                        logger.warning("Search endpoint %s returned status %s", i+1, response.status_code)
                         continue
                         
                 except Exception as endpoint_error:
-                    logger.warning(f"Search endpoint {i+1} failed: {endpoint_error}")
+                    logger.warning("Search endpoint %s failed: %s", i+1, endpoint_error)
                     continue
             
             # If all search endpoints failed, return error (NO FALLBACK)
             raise Exception("All NASA search endpoints failed")
             
         except Exception as e:
-            logger.error(f"Search studies failed: {e}")
+            logger.error("Search studies failed: %s", e)
             
             # Return error response (NO FALLBACK)
             return {
@@ -545,28 +926,31 @@ class NASAClient:
 
     async def get_organisms(self) -> Dict[str, Any]:
         """Get list of organisms from actual NASA OSDR datasets."""
+        return await self._cached_get("nasa:organisms", self._fetch_organisms, ttl=REFERENCE_TTL)
+
+    async def _fetch_organisms(self) -> Dict[str, Any]:
+        """Fetch organisms uncached."""
         logger.info("Fetching organisms from NASA OSDR datasets")
         
         try:
             # Fetch datasets to extract organisms
             datasets_response = await self.get_datasets(limit=100, page=0)
+            if "error" in datasets_response:
+                # Don't let an OSDR outage be cached as an empty list
+                raise Exception(datasets_response["error"])
             datasets = datasets_response.get('data', [])
             
-            # Extract unique organisms from datasets
-            organisms_set = set()
-            organism_counts = {}
-            
-            for dataset in datasets:
-                organism = dataset.get('organism')
-                if organism and organism != 'Unknown' and organism.strip():
-                    organisms_set.add(organism)
-                    organism_counts[organism] = organism_counts.get(organism, 0) + 1
+            # Count unique organisms from datasets
+            organisms = [
+                organism for dataset in datasets
+                if (organism := (dataset.get('organism') or '').strip()) not in _BAD_ORGANISMS
+            ]
+            organism_counts = Counter(organisms)
             
-            # Sort by count (most common first)
-            sorted_organisms = sorted(organism_counts.items(), key=lambda x: x[1], reverse=True)
-            organism_names = [org[0] for org in sorted_organisms]
+            # Most common first
+            organism_names = [organism for organism, _ in organism_counts.most_common()]
             
-            logger.info(f"Found {len(organism_names)} unique organisms from NASA OSDR datasets")
+            logger.info("Found %s unique organisms from NASA OSDR datasets", len(organism_names))
             
             return {
                 "organisms": organism_names,
@@ -575,7 +959,7 @@ class NASAClient:
             }
             
         except Exception as e:
-            logger.error(f"Failed to fetch organisms from NASA OSDR: {e}")
+            logger.error("Failed to fetch organisms from NASA OSDR: %s", e)
             return {
                 "organisms": [],
                 "source": "Error",
@@ -585,28 +969,31 @@ class NASAClient:
 
     async def get_missions(self) -> Dict[str, Any]:
         """Get list of space missions from actual NASA OSDR datasets."""
+        return await self._cached_get("nasa:missions", self._fetch_missions, ttl=REFERENCE_TTL)
+
+    async def _fetch_missions(self) -> Dict[str, Any]:
+        """Fetch missions uncached."""
         logger.info("Fetching missions from NASA OSDR datasets")
         
         try:
             # Fetch datasets to extract missions
             datasets_response = await self.get_datasets(limit=100, page=0)
+            if "error" in datasets_response:
+                # Don't let an OSDR outage be cached as an empty list
+                raise Exception(datasets_response["error"])
             datasets = datasets_response.get('data', [])
             
-            # Extract unique missions from datasets
-            missions_set = set()
-            mission_counts = {}
-            
-            for dataset in datasets:
-                mission = dataset.get('mission')
-                if mission and mission != 'Unknown' and mission != 'Unknown Mission' and mission.strip():
-                    missions_set.add(mission)
-                    mission_counts[mission] = mission_counts.get(mission, 0) + 1
+            # Count unique missions from datasets
+            missions = [
+                mission for dataset in datasets
+                if (mission := (dataset.get('mission') or '').strip()) not in _BAD_MISSIONS
+            ]
+            mission_counts = Counter(missions)
             
-            # Sort by count (most common first)
-            sorted_missions = sorted(mission_counts.items(), key=lambda x: x[1], reverse=True)
-            mission_names = [mission[0] for mission in sorted_missions]
+            # Most common first
+            mission_names = [mission for mission, _ in mission_counts.most_common()]
             
-            logger.info(f"Found {len(mission_names)} unique missions from NASA OSDR datasets")
+            logger.info("Found %s unique missions from NASA OSDR datasets", len(mission_names))
             
             return {
                 "missions": mission_names,
@@ -615,7 +1002,7 @@ class NASAClient:
             }
             
         except Exception as e:
-            logger.error(f"Failed to fetch missions from NASA OSDR: {e}")
+            logger.error("Failed to fetch missions from NASA OSDR: %s", e)
             return {
                 "missions": [],
                 "source": "Error",
@@ -625,193 +1012,192 @@ class NASAClient:
 
     async def get_experiments(self) -> Dict[str, Any]:
         """Get experiments from GEODE experiments API."""
+        return await self._cached_get("nasa:experiments", self._fetch_experiments, ttl=REFERENCE_TTL)
+
+    async def _fetch_experiments(self) -> Dict[str, Any]:
+        """Fetch experiments uncached."""
         try:
-            url = f"{self.geode_base}/geode-py/ws/api/experiments"
-            response = await self.client.get(url)
-            response.raise_for_status()
-            return response.json()
+            return await self._get_json(self._url_experiments)
         except Exception as e:
-            logger.error(f"Failed to fetch experiments: {e}")
+            logger.error("Failed to fetch experiments: %s", e)
             return {"experiments": [], "error": str(e)}
 
     async def get_payloads(self) -> Dict[str, Any]:
         """Get payloads from GEODE payloads API."""
+        return await self._cached_get("nasa:payloads", self._fetch_payloads, ttl=REFERENCE_TTL)
+
+    async def _fetch_payloads(self) -> Dict[str, Any]:
+        """Fetch payloads uncached."""
         try:
-            url = f"{self.geode_base}/geode-py/ws/api/payloads"
-            response = await self.client.get(url)
-            response.raise_for_status()
-            return response.json()
+            return await self._get_json(self._url_payloads)
         except Exception as e:
-            logger.error(f"Failed to fetch payloads: {e}")
+            logger.error("Failed to fetch payloads: %s", e)
             return {"payloads": [], "error": str(e)}
 
     async def get_hardware(self) -> Dict[str, Any]:
         """Get hardware from GEODE hardware API."""
+        return await self._cached_get("nasa:hardware", self._fetch_hardware, ttl=REFERENCE_TTL)
+
+    async def _fetch_hardware(self) -> Dict[str, Any]:
+        """Fetch hardware uncached."""
         try:
-            url = f"{self.geode_base}/geode-py/ws/api/hardware"
-            response = await self.client.get(url)
-            response.raise_for_status()
-            return response.json()
+            return await self._get_json(self._url_hardware)
         except Exception as e:
-            logger.error(f"Failed to fetch hardware: {e}")
+            logger.error("Failed to fetch hardware: %s", e)
             return {"hardware": [], "error": str(e)}
 
     async def get_vehicles(self) -> Dict[str, Any]:
         """Get vehicles from GEODE vehicles API."""
+        return await self._cached_get("nasa:vehicles", self._fetch_vehicles, ttl=REFERENCE_TTL)
+
+    async def _fetch_vehicles(self) -> Dict[str, Any]:
+        """Fetch vehicles uncached."""
         try:
-            url = f"{self.geode_base}/geode-py/ws/api/vehicles"
-            response = await self.client.get(url)
-            response.raise_for_status()
-            return response.json()
+            return await self._get_json(self._url_vehicles)
         except Exception as e:
-            logger.error(f"Failed to fetch vehicles: {e}")
+            logger.error("Failed to fetch vehicles: %s", e)
             return {"vehicles": [], "error": str(e)}
 
     async def get_biospecimens(self) -> Dict[str, Any]:
         """Get biospecimens from GEODE biospecimens API."""
+        return await self._cached_get("nasa:biospecimens", self._fetch_biospecimens, ttl=REFERENCE_TTL)
+
+    async def _fetch_biospecimens(self) -> Dict[str, Any]:
+        """Fetch biospecimens uncached."""
         try:
-            url = f"{self.geode_base}/geode-py/ws/api/biospecimens"
-            response = await self.client.get(url)
-            response.raise_for_status()
-            return response.json()
+            return await self._get_json(self._url_biospecimens)
         except Exception as e:
-            logger.error(f"Failed to fetch biospecimens: {e}")
+            logger.error("Failed to fetch biospecimens: %s", e)
             return {"biospecimens": [], "error": str(e)}
 
+    async def get_geode_bundle(self) -> Dict[str, Any]:
+        """Get all GEODE catalogues concurrently instead of one after another."""
+        names = ("experiments", "payloads", "hardware", "vehicles", "biospecimens")
+        results = await asyncio.gather(
+            self.get_experiments(),
+            self.get_payloads(),
+            self.get_hardware(),
+            self.get_vehicles(),
+            self.get_biospecimens(),
+            return_exceptions=True
+        )
+        
+        bundle = {}
+        for name, result in zip(names, results):
+            if isinstance(result, Exception):
+                logger.error("Failed to fetch %s: %s", name, result)
+                result = {name: [], "error": str(result)}
+            bundle[name] = result
+        return bundle
+
     async def get_metadata(self, study_id: str) -> Dict[str, Any]:
         """Get study metadata using OSDR metadata API."""
+        return await self._inflight.do(f"meta:{study_id}", lambda: self._fetch_metadata(study_id))
+
+    async def _fetch_metadata(self, study_id: str) -> Dict[str, Any]:
+        """Fetch study metadata from the persistent cache or OSDR."""
+        key = f"meta:{study_id}"
+        cached = await self._disk_get(key)
+        if cached is not None:
+            return cached
+        
+        data = await self._request_metadata(study_id)
+        if "error" not in data:
+            await self._disk_set(key, data, source_version=data.get("last_modified"))
+        return data
+
+    async def _request_metadata(self, study_id: str) -> Dict[str, Any]:
+        """Request study metadata from the OSDR metadata API."""
         try:
-            url = f"{self.osdr_base}/osdr/data/osd/meta/{study_id}"
-            logger.info(f"Fetching metadata for study {study_id} from {url}")
+            url = self._meta_url_tpl(study_id)
+            logger.info("Fetching metadata for study %s from %s", study_id, url)
             
-            response = await self.client.get(url, timeout=15.0)
+            response = await self._get(url, timeout=15.0)
             
             if response.status_code == 200:
-                data = response.json()
-                logger.info(f"Metadata response keys: {data.keys() if isinstance(data, dict) else 'not a dict'}")
+                data = self._json(response)
+                logger.info("Metadata response keys: %s", data.keys() if isinstance(data, dict) else 'not a dict')
                 
                 # OSDR metadata API returns: {"hits": N, "input": "OSD-XXX", "study": {...}, "success": true}
                 if isinstance(data, dict) and 'study' in data:
                     study_data = data.get('study', {})
                     if study_data:
-                        logger.info(f"Found study data with {len(study_data)} fields")
+                        logger.info("Found study data with %s fields", len(study_data))
                         return study_data
                     else:
-                        logger.warning(f"Empty study data for {study_id}")
+                        logger.warning("Empty study data for %s", study_id)
                         return data  # Return the whole response
                 else:
-                    logger.warning(f"Unexpected metadata format for {study_id}")
+                    logger.warning("Unexpected metadata format for %s", study_id)
                     return data
             else:
-                logger.error(f"Metadata API returned {response.status_code} for {study_id}")
+                logger.error("Metadata API returned %s for %s", response.status_code, study_id)
                 raise Exception(f"Metadata API returned {response.status_code}")
             
         except Exception as e:
-            logger.error(f"Failed to fetch metadata for {study_id}: {e}")
+            logger.error("Failed to fetch metadata for %s: %s", study_id, e)
             return {"error": f"Failed to fetch metadata: {str(e)}"}
 
     async def get_files(self, study_ids: str, page: int = 0, size: int = 25, all_files: bool = False) -> Dict[str, Any]:
         """Get file list for study using OSDR files API."""
+        return await self._inflight.do(
+            f"files:{study_ids}:{page}:{size}:{all_files}",
+            lambda: self._fetch_files(study_ids, page, size, all_files)
+        )
+
+    async def _fetch_files(self, study_ids: str, page: int, size: int, all_files: bool) -> Dict[str, Any]:
+        """Fetch a study file listing from the persistent cache or OSDR."""
+        key = f"files:{study_ids}:{page}:{size}:{all_files}"
+        cached = await self._disk_get(key)
+        if cached is not None:
+            return cached
+        
+        data = await self._request_files(study_ids, page, size, all_files)
+        if "error" not in data:
+            await self._disk_set(key, data)
+        return data
+
+    async def _request_files(self, study_ids: str, page: int, size: int, all_files: bool) -> Dict[str, Any]:
+        """Request a study file listing from the OSDR files API."""
         try:
             # NASA OSDR Files API endpoint
-            url = f"{self.osdr_base}/osdr/data/osd/files/{study_ids}"
+            url = self._files_url_tpl(study_ids)
             params = {
                 "page": page, 
                 "size": size, 
                 "all_files": str(all_files).lower()
             }
             
-            logger.info(f"Fetching files for study {study_ids} from {url}")
-            response = await self.client.get(url, params=params, timeout=15.0)
+            logger.info("Fetching files for study %s from %s", study_ids, url)
             
-            if response.status_code == 200:
-                data = response.json()
-                logger.info(f"Files API response type: {type(data)}")
-                logger.info(f"Files API response keys: {data.keys() if isinstance(data, dict) else 'list'}")
-                
-                # Parse the response structure
-                files_list = []
-                
-                # OSDR returns files in different formats
-                if isinstance(data, dict):
-                    # Log what we got
-                    logger.info(f"Response structure: {list(data.keys())}")
-                    
-                    # Format 1: Direct files array
-                    if 'files' in data and isinstance(data['files'], list):
-                        files_list = data['files']
-                        logger.info(f"Found {len(files_list)} files in 'files' key")
-                    # Format 2: Study files object
-                    elif 'study_files' in data:
-                        files_list = data['study_files']
-                        logger.info(f"Found files in 'study_files' key")
-                    # Format 3: Data files
-                    elif 'data_files' in data:
-                        files_list = data['data_files']
-                        logger.info(f"Found files in 'data_files' key")
-                    # Format 4: Check if the dict itself is empty (no files available)
-                    elif not data or len(data) == 0:
-                        logger.warning(f"Empty response from files API for {study_ids}")
-                        files_list = []
-                    
-                    # Extract file information
-                    processed_files = []
-                    for file_item in files_list:
-                        if isinstance(file_item, dict):
-                            processed_file = {
-                                "file_name": file_item.get('file_name') or file_item.get('name') or file_item.get('filename'),
-                                "file_size": file_item.get('file_size') or file_item.get('size'),
-                                "file_type": file_item.get('file_type') or file_item.get('type'),
-                                "file_url": file_item.get('file_url') or file_item.get('url') or file_item.get('download_url'),
-                                "remote_url": file_item.get('remote_url'),
-                                "subdirectory": file_item.get('subdirectory') or file_item.get('path'),
-                                "description": file_item.get('description')
-                            }
-                            processed_files.append(processed_file)
-                    
-                    logger.info(f"Processed {len(processed_files)} files for study {study_ids}")
-                    
+            # Full listings can be megabytes; parse them as they arrive
+            if all_files and IJSON_AVAILABLE:
+                processed_files, total, raw = await self._stream_files(url, params)
+                if processed_files is not None:
+                    logger.info("Streamed %s files for study %s", len(processed_files), study_ids)
                     return {
                         "study_id": study_ids,
                         "files": processed_files,
-                        "total": data.get('total', len(processed_files)),
+                        "total": total if total is not None else len(processed_files),
                         "page": page,
                         "size": size,
                         "source": "NASA OSDR Files API",
                         "message": f"Found {len(processed_files)} files" if processed_files else "No public files available for this study"
                     }
-                elif isinstance(data, list):
-                    # Direct array response
-                    processed_files = []
-                    for file_item in data:
-                        if isinstance(file_item, dict):
-                            processed_file = {
-                                "file_name": file_item.get('file_name') or file_item.get('name'),
-                                "file_size": file_item.get('file_size') or file_item.get('size'),
-                                "file_type": file_item.get('file_type') or file_item.get('type'),
-                                "file_url": file_item.get('file_url') or file_item.get('url'),
-                                "remote_url": file_item.get('remote_url'),
-                                "subdirectory": file_item.get('subdirectory')
-                            }
-                            processed_files.append(processed_file)
-                    
-                    return {
-                        "study_id": study_ids,
-                        "files": processed_files,
-                        "total": len(processed_files),
-                        "page": page,
-                        "size": size,
-                        "source": "NASA OSDR Files API"
-                    }
-                else:
-                    logger.warning(f"Unexpected file response format for {study_ids}")
-                    raise Exception("Unexpected file response format")
-            else:
-                logger.error(f"Files API returned status {response.status_code} for {study_ids}")
+                if raw is not None:
+                    # Not the 'files' array shape - reuse the buffered body
+                    return self._files_response(orjson.loads(raw), study_ids, page, size)
+                # The 'files' array failed mid-parse after its bytes were let go; fetch it again
+            
+            response = await self._get(url, params=params, timeout=15.0)
+            
+            if response.status_code != 200:
+                logger.error("Files API returned status %s for %s", response.status_code, study_ids)
                 raise Exception(f"Files API returned {response.status_code}")
+            return self._files_response(self._json(response), study_ids, page, size)
             
         except Exception as e:
-            logger.error(f"Failed to fetch files for {study_ids}: {e}")
+            logger.error("Failed to fetch files for %s: %s", study_ids, e)
             
             # Return error response (NO FALLBACK)
             return {
@@ -825,29 +1211,208 @@ class NASAClient:
                 "message": "This study may not have public files available yet, or the study ID may be incorrect."
             }
 
+    def _files_response(self, data: Any, study_ids: str, page: int, size: int) -> Dict[str, Any]:
+        """Normalize a decoded files API response (any of its known shapes)."""
+        logger.info("Files API response type: %s", type(data))
+        logger.info("Files API response keys: %s", data.keys() if isinstance(data, dict) else 'list')
+        
+        # Parse the response structure
+        files_list = []
+        
+        # OSDR returns files in different formats
+        if isinstance(data, dict):
+            # Log what we got
+            logger.info("Response structure: %s", list(data.keys()))
+            
+            # Format 1: Direct files array
+            if 'files' in data and isinstance(data['files'], list):
+                files_list = data['files']
+                logger.info("Found %s files in 'files' key", len(files_list))
+            # Format 2: Study files object
+            elif 'study_files' in data:
+                files_list = data['study_files']
+                logger.info("Found files in 'study_files' key")
+            # Format 3: Data files
+            elif 'data_files' in data:
+                files_list = data['data_files']
+                logger.info("Found files in 'data_files' key")
+            # Format 4: Check if the dict itself is empty (no files available)
+            elif not data or len(data) == 0:
+                logger.warning("Empty response from files API for %s", study_ids)
+                files_list = []
+            
+            total = data.get('total')
+            if not files_list:
+                return {
+                    "study_id": study_ids,
+                    "files": [],
+                    "total": total or 0,
+                    "page": page,
+                    "size": size,
+                    "source": "NASA OSDR Files API",
+                    "message": "No public files available for this study"
+                }
+            
+            # Extract file information
+            aliases = self._FILE_ALIASES
+            processed_files = [
+                {field: first_value(file_item, keys) for field, keys in aliases}
+                for file_item in files_list
+                if isinstance(file_item, dict)
+            ]
+            
+            logger.info("Processed %s files for study %s", len(processed_files), study_ids)
+            
+            return {
+                "study_id": study_ids,
+                "files": processed_files,
+                "total": total if total is not None else len(processed_files),
+                "page": page,
+                "size": size,
+                "source": "NASA OSDR Files API",
+                "message": f"Found {len(processed_files)} files" if processed_files else "No public files available for this study"
+            }
+        elif isinstance(data, list):
+            # Direct array response
+            aliases = self._FILE_LIST_ALIASES
+            processed_files = [
+                {field: first_value(file_item, keys) for field, keys in aliases}
+                for file_item in data
+                if isinstance(file_item, dict)
+            ]
+            
+            return {
+                "study_id": study_ids,
+                "files": processed_files,
+                "total": len(processed_files),
+                "page": page,
+                "size": size,
+                "source": "NASA OSDR Files API"
+            }
+        else:
+            logger.warning("Unexpected file response format for %s", study_ids)
+            raise Exception("Unexpected file response format")
+
+    async def _stream_files(
+        self, url: str, params: Dict[str, Any]
+    ) -> Tuple[Optional[List[Dict[str, Any]]], Optional[int], Optional[bytearray]]:
+        """Stream a files API response, normalizing each entry of its 'files' array as it is parsed.
+        
+        Raw file records are never materialized as a whole, and the body is
+        only buffered until the 'files' array is found. Returns the normalized
+        files and the upstream 'total' (None if absent), or files=None with the
+        buffered body when the response has another shape. (None, None, None)
+        means the 'files' array could not be parsed and the caller should
+        request the listing again. Retries like _get.
+        """
+        for attempt in range(1, RETRY_ATTEMPTS + 1):
+            try:
+                async with self.client.stream("GET", url, params=params, timeout=15.0) as response:
+                    if response.status_code in RETRY_STATUSES and attempt < RETRY_ATTEMPTS:
+                        logger.warning("%s returned %s (attempt %s/%s), retrying", url, response.status_code, attempt, RETRY_ATTEMPTS)
+                    elif response.status_code != 200:
+                        raise Exception(f"Files API returned {response.status_code}")
+                    else:
+                        return await self._parse_files_stream(url, _AsyncByteReader(response))
+            except httpx.TransportError as e:
+                if attempt == RETRY_ATTEMPTS:
+                    raise
+                logger.warning("%s failed: %s (attempt %s/%s), retrying", url, e, attempt, RETRY_ATTEMPTS)
+            
+            await self._backoff(attempt)
+
+    async def _parse_files_stream(
+        self, url: str, reader: _AsyncByteReader
+    ) -> Tuple[Optional[List[Dict[str, Any]]], Optional[int], Optional[bytearray]]:
+        """Pull normalized 'files' entries and 'total' out of a streamed files API body."""
+        aliases = self._FILE_ALIASES
+        processed_files = None
+        total = None
+        builder = None
+        try:
+            async for prefix, event, value in ijson.parse_async(reader):
+                if builder is not None:
+                    builder.event(event, value)
+                    if prefix == "files.item" and event == "end_map":
+                        processed_files.append({field: first_value(builder.value, keys) for field, keys in aliases})
+                        builder = None
+                elif prefix == "files.item" and event == "start_map":
+                    builder = ijson.ObjectBuilder()
+                    builder.event(event, value)
+                elif prefix == "files" and event == "start_array":
+                    # The streamed shape is confirmed; stop keeping the raw bytes
+                    processed_files = []
+                    reader.body = None
+                elif prefix == "total" and event == "number":
+                    total = value
+        except httpx.TransportError:
+            raise
+        except Exception as e:
+            logger.warning("Incremental parse of %s failed, using buffered parse: %s", url, e)
+            processed_files = None
+        if processed_files is not None:
+            return processed_files, total, None
+        if reader.body is not None:
+            # Drain whatever ijson didn't need so the body is complete for the fallback
+            await reader.read()
+        return None, None, reader.body
+
     async def get_study_details(self, study_id: str) -> Dict[str, Any]:
         """Get comprehensive study details combining metadata and basic info."""
+        cached = await self._details_cache.get(study_id)
+        if cached is not None:
+            return _shallow_copy(cached)
+        # Copy per caller: coalesced waiters all receive the one dict the shared fetch returns
+        details = await self._inflight.do(f"details:{study_id}", lambda: self._fetch_study_details(study_id))
+        return _shallow_copy(details)
+
+    async def get_study_details_batch(self, study_ids: List[str], concurrency: int = 16) -> List[Dict[str, Any]]:
+        """Get details for several studies concurrently, in input order.
+        
+        At most `concurrency` lookups run at once so a large batch cannot
+        exhaust the connection pool; each one shares the details cache and
+        single-flight with get_study_details.
+        """
+        sem = asyncio.Semaphore(concurrency)
+
+        async def one(study_id: str) -> Dict[str, Any]:
+            async with sem:
+                return await self.get_study_details(study_id)
+
+        return await asyncio.gather(*(one(study_id) for study_id in study_ids))
+
+    async def _fetch_study_details(self, study_id: str) -> Dict[str, Any]:
+        """Fetch study details and cache the outcome (errors are not cached)."""
+        details = await self._request_study_details(study_id)
+        if details.get("source") == "NASA OSDR API (No Data)":
+            await self._details_cache.set(study_id, details, ttl=DETAILS_EMPTY_TTL)
+        elif "error" not in details:
+            await self._details_cache.set(study_id, details, ttl=DETAILS_TTL)
+        return details
+
+    async def _request_study_details(self, study_id: str) -> Dict[str, Any]:
+        """Assemble study details from the OSDR search API, falling back to the metadata API."""
         try:
-            logger.info(f"Fetching comprehensive details for study {study_id}")
+            logger.info("Fetching comprehensive details for study %s", study_id)
             
             # FIRST: Try to get from search API (has descriptions)
             try:
-                search_url = f"{self.osdr_base}/osdr/data/search"
+                search_url = self._search_url
                 params = {"term": study_id, "size": 1}
                 
-                logger.info(f"Searching for {study_id} in OSDR search API")
+                logger.info("Searching for %s in OSDR search API", study_id)
                 response = await self.client.get(search_url, params=params, timeout=15.0)
                 
                 if response.status_code == 200:
-                    data = response.json()
+                    data = self._json(response)
                     if data.get('hits', {}).get('hits'):
                         hit = data['hits']['hits'][0]
                         source = hit.get('_source', {})
                         
                         # Check if this is the right study
                         if source.get('Study Identifier') == study_id:
-                            logger.info(f"Found {study_id} in search API with full data")
-                            study_data = self._transform_osdr_hit_to_dataset(hit)
+                            logger.info("Found %s in search API with full data", study_id)
+                            study_data = self._transform_osdr_hit_cached(hit)
                             
                             return {
                                 "study_id": study_id,
@@ -862,13 +1427,13 @@ class NASAClient:
                                 **study_data  # Include all other fields
                             }
             except Exception as e:
-                logger.warning(f"Could not fetch {study_id} from search API: {e}")
+                logger.warning("Could not fetch %s from search API: %s", study_id, e)
             
             # SECOND: Fall back to metadata API
             metadata = await self.get_metadata(study_id)
             
             if "error" in metadata:
-                logger.warning(f"Metadata fetch failed for {study_id}")
+                logger.warning("Metadata fetch failed for %s", study_id)
                 # Return error response (NO FALLBACK)
                 return {
                     "study_id": study_id,
@@ -882,7 +1447,7 @@ class NASAClient:
             
             # Check if metadata is actually empty (study doesn't exist or no public data)
             if not metadata or (isinstance(metadata, dict) and len(metadata) == 0):
-                logger.warning(f"Study {study_id} has no metadata in OSDR")
+                logger.warning("Study %s has no metadata in OSDR", study_id)
                 return {
                     "study_id": study_id,
                     "title": f"Study {study_id}",
@@ -919,11 +1484,11 @@ class NASAClient:
             if metadata.get("Study Assay Measurement Type"):
                 study_details["data_types"].append(metadata["Study Assay Measurement Type"])
             
-            logger.info(f"Successfully fetched complete details for {study_id}")
+            logger.info("Successfully fetched complete details for %s", study_id)
             return study_details
             
         except Exception as e:
-            logger.error(f"Failed to get study details for {study_id}: {e}")
+            logger.error("Failed to get study details for %s: %s", study_id, e)
             return {
                 "study_id": study_id,
                 "title": f"Study {study_id}",
@@ -936,109 +1501,21 @@ class NASAClient:
     async def _get_sample_datasets(self) -> List[Dict[str, Any]]:
         """Get sample datasets - DEPRECATED: System now uses only real NASA OSDR data."""
         logger.warning("Sample datasets method called - this should not happen in production")
-        return [
-            {
-                "id": "GLDS-104",
-                "title": "Spaceflight Effects on Arabidopsis Gene Expression",
-                "description": "Analysis of Arabidopsis thaliana grown aboard the International Space Station to understand how spaceflight affects plant gene expression and development. This study examines transcriptomic changes in plant tissues exposed to microgravity.",
-                "organism": "Arabidopsis thaliana",
-                "mission": "SpaceX CRS-3",
-                "data_types": ["RNA-seq", "Microarray"],
-                "release_date": "2023-08-15",
-                "study_type": "Transcriptome",
-                "publications": 3,
-                "samples": 24
-            },
-            {
-                "id": "GLDS-242",
-                "title": "Microgravity-Induced Changes in Mouse Muscle",
-                "description": "Investigation of muscle atrophy and protein degradation pathways in mice exposed to microgravity conditions during long-duration spaceflight missions. Focuses on skeletal muscle adaptations.",
-                "organism": "Mus musculus",
-                "mission": "SpaceX CRS-18",
-                "data_types": ["Proteome", "Western Blot"],
-                "release_date": "2023-09-22",
-                "study_type": "Proteome",
-                "publications": 7,
-                "samples": 48
-            },
-            {
-                "id": "GLDS-321",
-                "title": "Radiation Response in Human Cell Cultures",
-                "description": "Study of DNA repair mechanisms and cellular stress responses in human fibroblast cultures exposed to space radiation levels. Examines genomic stability and repair pathway activation.",
-                "organism": "Homo sapiens",
-                "mission": "ISS Expedition 65",
-                "data_types": ["RNA-seq", "ChIP-seq", "ATAC-seq"],
-                "release_date": "2023-11-10",
-                "study_type": "Multi-omics",
-                "publications": 5,
-                "samples": 36
-            },
-            {
-                "id": "GLDS-158",
-                "title": "Fruit Fly Circadian Rhythms in Space",
-                "description": "Analysis of circadian clock disruption in Drosophila melanogaster during spaceflight. Investigates changes in sleep-wake cycles and clock gene expression patterns in microgravity.",
-                "organism": "Drosophila melanogaster",
-                "mission": "SpaceX CRS-12",
-                "data_types": ["RNA-seq", "Behavioral Analysis"],
-                "release_date": "2023-07-30",
-                "study_type": "Behavioral Genomics",
-                "publications": 4,
-                "samples": 72
-            },
-            {
-                "id": "GLDS-275",
-                "title": "Bone Density Loss in Rat Models",
-                "description": "Comprehensive analysis of bone mineral density changes and osteoblast activity in rats during extended exposure to microgravity conditions. Studies calcium metabolism and bone formation.",
-                "organism": "Rattus norvegicus",
-                "mission": "SpaceX CRS-21",
-                "data_types": ["MicroCT", "Histology", "qPCR"],
-                "release_date": "2023-10-05",
-                "study_type": "Physiology",
-                "publications": 6,
-                "samples": 60
-            },
-            {
-                "id": "GLDS-199",
-                "title": "Microbial Community Changes in Space",
-                "description": "Metagenomic analysis of microbial communities aboard the International Space Station. Examines how microgravity and radiation affect bacterial growth patterns and antibiotic resistance.",
-                "organism": "Escherichia coli",
-                "mission": "ISS Expedition 63",
-                "data_types": ["16S rRNA", "Metagenomics"],
-                "release_date": "2023-06-18",
-                "study_type": "Microbiome",
-                "publications": 8,
-                "samples": 144
-            },
-            {
-                "id": "GLDS-87",
-                "title": "Yeast Cell Cycle in Microgravity",
-                "description": "Investigation of cell division and cell cycle regulation in Saccharomyces cerevisiae under microgravity conditions. Studies cell wall formation and budding patterns.",
-                "organism": "Saccharomyces cerevisiae",
-                "mission": "SpaceX CRS-8",
-                "data_types": ["RNA-seq", "Flow Cytometry"],
-                "release_date": "2023-05-12",
-                "study_type": "Cell Biology",
-                "publications": 2,
-                "samples": 18
-            },
-            {
-                "id": "GLDS-312",
-                "title": "Nematode Aging in Space Environment",
-                "description": "Long-term study of aging processes and lifespan in C. elegans exposed to spaceflight conditions. Examines oxidative stress responses and longevity gene expression.",
-                "organism": "Caenorhabditis elegans",
-                "mission": "SpaceX CRS-24",
-                "data_types": ["RNA-seq", "Lifespan Analysis"],
-                "release_date": "2024-01-08",
-                "study_type": "Aging Research",
-                "publications": 3,
-                "samples": 96
-            }
-        ]
+        return list(_SAMPLE_DATASETS)
 
     async def close(self):
-        """Close the HTTP client connection."""
+        """Cancel background tasks and close the HTTP client connection (safe to call twice)."""
+        if self._closed:
+            return
+        self._closed = True
+        
+        tasks = list(self._bg_tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        
         try:
             await self.client.aclose()
             logger.info("NASA client connection closed")
         except Exception as e:
-            logger.error(f"Error closing NASA client: {e}")
+            logger.error("Error closing NASA client: %s", e)
@@ -3,42 +3,45 @@
 Defines request/response models for type safety and API documentation.
 """
 
-from pydantic import BaseModel, Field
-from typing import Any, List, Optional, Dict, Union
-from datetime import datetime
-
-class Dataset(BaseModel):
-    """NASA space biology dataset model."""
-    id: str = Field(..., description="Unique dataset identifier")
-    title: Optional[str] = Field(None, description="Dataset title")
-    description: Optional[str] = Field(None, description="Dataset description")
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator, model_validator
+from typing import Annotated, Any, List, Literal, Optional, Dict, Tuple, Union
+from .internal_schemas import GraphEdge, GraphNode
+from .schemas_util import first_value
+
+class _StudyBase(BaseModel):
+    """Fields shared by the study models, so pydantic builds their schemas once."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
+    id: Optional[str] = Field(None, description="Study identifier")
+    title: Optional[str] = Field(None, description="Study title")
+    description: Optional[str] = Field(None, description="Study description")
     organism: Optional[str] = Field(None, description="Primary organism studied")
     mission: Optional[str] = Field(None, description="Space mission")
+    data_types: Tuple[str, ...] = Field((), description="Types of data collected")
+    
+    @field_validator("data_types", mode="before")
+    @classmethod
+    def _null_as_empty(cls, v):
+        return v or ()
+
+class Dataset(_StudyBase):
+    """NASA space biology dataset model."""
+    id: str = Field(..., description="Unique dataset identifier")
     release_date: Optional[str] = Field(None, description="Data release date")
-    data_types: Optional[List[str]] = Field(default_factory=list, description="Types of data collected")
+    # Dict[str, Any] only checks the top-level keys; nested payload values pass through as-is
     raw: Optional[Dict[str, Any]] = Field(None, description="Raw API response data")
 
 class SearchFilters(BaseModel):
     """Search filters for NASA space biology studies."""
     query: Optional[str] = Field("", description="Natural language search query")
-    organisms: Optional[List[str]] = Field(default_factory=list, description="Filter by organisms")
-    missions: Optional[List[str]] = Field(default_factory=list, description="Filter by missions")
-    data_types: Optional[List[str]] = Field(default_factory=list, description="Filter by data types")
-
-class GraphNode(BaseModel):
-    """Knowledge graph node model."""
-    id: str = Field(..., description="Unique node identifier")
-    label: str = Field(..., description="Node display label")
-    type: str = Field(..., description="Node type (study, organism, mission, etc.)")
-    properties: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Additional node properties")
-
-class GraphEdge(BaseModel):
-    """Knowledge graph edge model."""
-    id: str = Field(..., description="Unique edge identifier")
-    source: str = Field(..., description="Source node ID")
-    target: str = Field(..., description="Target node ID")
-    label: str = Field(..., description="Relationship type")
-    properties: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Additional edge properties")
+    organisms: Tuple[str, ...] = Field((), description="Filter by organisms")
+    missions: Tuple[str, ...] = Field((), description="Filter by missions")
+    data_types: Tuple[str, ...] = Field((), description="Filter by data types")
+    
+    @field_validator("organisms", "missions", "data_types", mode="before")
+    @classmethod
+    def _null_as_empty(cls, v):
+        return v or ()
 
 class GraphResponse(BaseModel):
     """Knowledge graph response model."""
@@ -49,15 +52,77 @@ class GraphResponse(BaseModel):
     provider: Optional[str] = Field(None, description="Data provider (neo4j, sqlite, etc.)")
     error: Optional[str] = Field(None, description="Error message if applicable")
 
-class SearchResult(BaseModel):
-    """Search result item model."""
-    id: str = Field(..., description="Study identifier")
-    title: Optional[str] = Field(None, description="Study title")
-    description: Optional[str] = Field(None, description="Study description")
-    organism: Optional[str] = Field(None, description="Primary organism")
-    mission: Optional[str] = Field(None, description="Space mission")
-    data_types: Optional[List[str]] = Field(default_factory=list, description="Data types")
-    relevance_score: Optional[float] = Field(None, description="Search relevance score")
+class GraphResponseSoA(BaseModel):
+    """Knowledge graph response in struct-of-arrays layout.
+    
+    Node and edge attributes are held in parallel columns (index i of each
+    node_* list describes the same node), so clients that need a single
+    column, e.g. only node_ids, don't walk whole node objects.
+    """
+    node_ids: List[str] = Field(default_factory=list, description="Node identifiers")
+    node_labels: List[str] = Field(default_factory=list, description="Node labels")
+    node_types: List[str] = Field(default_factory=list, description="Node types")
+    node_properties: List[Dict[str, Any]] = Field(default_factory=list, description="Node properties")
+    edge_ids: List[str] = Field(default_factory=list, description="Edge identifiers")
+    edge_sources: List[str] = Field(default_factory=list, description="Edge source node IDs")
+    edge_targets: List[str] = Field(default_factory=list, description="Edge target node IDs")
+    edge_labels: List[str] = Field(default_factory=list, description="Edge labels")
+    edge_properties: List[Dict[str, Any]] = Field(default_factory=list, description="Edge properties")
+    node_count: Optional[int] = Field(None, description="Total number of nodes")
+    edge_count: Optional[int] = Field(None, description="Total number of edges")
+    provider: Optional[str] = Field(None, description="Data provider (neo4j, sqlite, etc.)")
+    error: Optional[str] = Field(None, description="Error message if applicable")
+    
+    @model_validator(mode="after")
+    def _columns_aligned(self):
+        node_lengths = {len(self.node_ids), len(self.node_labels), len(self.node_types), len(self.node_properties)}
+        edge_lengths = {len(self.edge_ids), len(self.edge_sources), len(self.edge_targets), len(self.edge_labels), len(self.edge_properties)}
+        if len(node_lengths) > 1 or len(edge_lengths) > 1:
+            raise ValueError("node_* and edge_* columns must each have the same length")
+        return self
+    
+    def to_aos(self) -> GraphResponse:
+        """Convert to the array-of-structs GraphResponse shape."""
+        return GraphResponse(
+            nodes=[
+                GraphNode(id=i, label=label, type=t, properties=props)
+                for i, label, t, props in zip(self.node_ids, self.node_labels, self.node_types, self.node_properties)
+            ],
+            edges=[
+                GraphEdge(id=i, source=src, target=dst, label=label, properties=props)
+                for i, src, dst, label, props in zip(self.edge_ids, self.edge_sources, self.edge_targets, self.edge_labels, self.edge_properties)
+            ],
+            node_count=self.node_count,
+            edge_count=self.edge_count,
+            provider=self.provider,
+            error=self.error,
+        )
+
+# Fallback keys for search hits whose shape differs between OSDR endpoints
+SEARCH_ID_KEYS = ("id", "study_id", "OSD_STUDY_ID")
+SEARCH_TITLE_KEYS = ("title", "name")
+SEARCH_DESC_KEYS = ("description", "summary")
+
+def resolve_search_hit(hit: Dict[str, Any]) -> Dict[str, Any]:
+    """Map a raw search hit onto SearchResult fields.
+    
+    The single field-resolution rule for search hits: fallback keys are
+    tried like an ``or`` chain (see first_value), and values are passed
+    through without type coercion.
+    """
+    return {
+        "id": first_value(hit, SEARCH_ID_KEYS),
+        "title": first_value(hit, SEARCH_TITLE_KEYS),
+        "description": first_value(hit, SEARCH_DESC_KEYS),
+        "organism": hit.get("organism"),
+        "mission": hit.get("mission"),
+        "data_types": hit.get("data_types") or [],
+        "relevance_score": hit.get("score", 1.0)
+    }
+
+class SearchResult(_StudyBase):
+    """Search result item model (hits normalized by resolve_search_hit)."""
+    relevance_score: Optional[Union[int, float]] = Field(1.0, description="Search relevance score")
 
 class SearchResponse(BaseModel):
     """Search response model."""
@@ -68,8 +133,23 @@ class SearchResponse(BaseModel):
     search_params: Optional[Dict[str, Any]] = Field(None, description="Final search parameters used")
     timestamp: Optional[str] = Field(None, description="Response timestamp")
 
+class OrganismList(BaseModel):
+    """Organisms reference list response model."""
+    organisms: List[str] = Field(default_factory=list, description="Organism names, most studied first")
+    source: Optional[str] = Field(None, description="Data source")
+    total: Optional[int] = Field(None, description="Number of organisms")
+    error: Optional[str] = Field(None, description="Error message if applicable")
+
+class MissionList(BaseModel):
+    """Missions reference list response model."""
+    missions: List[str] = Field(default_factory=list, description="Mission names, most studied first")
+    source: Optional[str] = Field(None, description="Data source")
+    total: Optional[int] = Field(None, description="Number of missions")
+    error: Optional[str] = Field(None, description="Error message if applicable")
+
 class AIServiceStatus(BaseModel):
     """AI service status model."""
+    kind: Literal["ai"] = Field(..., description="Status discriminator")
     gemini_configured: bool = Field(False, description="Gemini API configured")
     openai_configured: bool = Field(False, description="OpenAI API configured")
     status: str = Field(..., description="Service status")
@@ -77,6 +157,7 @@ class AIServiceStatus(BaseModel):
 
 class ServiceStatus(BaseModel):
     """Generic service status model."""
+    kind: Literal["service"] = Field(..., description="Status discriminator")
     status: str = Field(..., description="Service status (healthy, degraded, unhealthy)")
     api_key_configured: Optional[bool] = Field(None, description="API key configured")
     last_response_time: Optional[str] = Field(None, description="Last response time")
@@ -92,7 +173,7 @@ class HealthResponse(BaseModel):
     timestamp: str = Field(..., description="Health check timestamp")
     environment: str = Field(..., description="Environment (development, production)")
     version: str = Field(..., description="Application version")
-    services: Dict[str, Union[ServiceStatus, AIServiceStatus, Dict[str, Any]]] = Field(
+    services: Dict[str, Annotated[Union[ServiceStatus, AIServiceStatus], Field(discriminator="kind")]] = Field(
         default_factory=dict, 
         description="Individual service statuses"
     )
@@ -102,6 +183,8 @@ class HealthResponse(BaseModel):
 
 class SummaryResponse(BaseModel):
     """AI summary response model."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     summary: str = Field(..., description="Generated summary text")
     provider: str = Field(..., description="AI provider used (gemini, openai, local_fallback)")
     model: Optional[str] = Field(None, description="Specific model used")
@@ -110,6 +193,8 @@ class SummaryResponse(BaseModel):
 
 class InsightsResponse(BaseModel):
     """AI insights response model."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     insights: List[str] = Field(default_factory=list, description="Generated insights")
     provider: str = Field(..., description="Provider used for insights generation")
     model: Optional[str] = Field(None, description="Specific model used")
@@ -118,6 +203,8 @@ class InsightsResponse(BaseModel):
 
 class TimelineEvent(BaseModel):
     """Timeline event model."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     date: str = Field(..., description="Event date")
     title: str = Field(..., description="Event title")
     description: Optional[str] = Field(None, description="Event description")
@@ -140,3 +227,9 @@ class DatasetResponse(BaseModel):
     count: int = Field(0, description="Number of results in this response")
     timestamp: str = Field(..., description="Response timestamp")
     error: Optional[str] = Field(None, description="Error message if applicable")
+
+# Serializers bound once at import for routes that emit JSON bytes straight from an
+# already-validated model instead of going through FastAPI's response_model encoding
+DUMPERS = {
+    HealthResponse: TypeAdapter(HealthResponse).dump_json,
+}
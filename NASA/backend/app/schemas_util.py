@@ -0,0 +1,31 @@
+"""Helpers shared by API response construction."""
+
+import time
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Mapping
+
+def first_value(item: Mapping[str, Any], keys: tuple) -> Any:
+    """Return the first truthy value among keys, matching a chain of ``or`` lookups.
+    
+    Like ``item.get(a) or item.get(b)``, the last key's value (possibly
+    None or empty) is returned when none of them is truthy.
+    """
+    value = None
+    for key in keys:
+        value = item.get(key)
+        if value:
+            return value
+    return value
+
+@lru_cache(maxsize=1)
+def _ts_bucket(bucket_id: int) -> str:
+    return datetime.fromtimestamp(bucket_id, timezone.utc).isoformat()
+
+def now_iso() -> str:
+    """Current UTC time as an ISO-8601 string at second precision.
+    
+    Formatted at most once per second; calls within the same second
+    (e.g. health-probe floods) reuse the cached string.
+    """
+    return _ts_bucket(int(time.time()))
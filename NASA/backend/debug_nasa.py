@@ -1,25 +1,60 @@
 """Debug script to test NASA OSDR API and see actual response"""
-import requests
+import asyncio
+import hashlib
 import json
+import time
+from pathlib import Path
+from urllib.parse import urlencode
 
 url = "https://osdr.nasa.gov/osdr/data/search"
 params = {"size": 5, "from": 0}
 
-print("Testing NASA OSDR API...")
-print(f"URL: {url}")
-print(f"Params: {params}\n")
+# Responses are cached on disk by a hash of the request so re-runs skip the round-trip
+CACHE_DIR = Path("/tmp/nasa_cache")
+CACHE_TTL = 3600
 
-try:
-    response = requests.get(url, params=params, timeout=30)
-    print(f"Status Code: {response.status_code}")
-    print(f"Headers: {dict(response.headers)}\n")
+def http_client():
+    """Build the HTTP client; httpx is imported here so cache hits never load it."""
+    import httpx
+    try:
+        import h2  # noqa: F401 - enables HTTP/2 in httpx
+        http2 = True
+    except ImportError:
+        http2 = False
+    return httpx.AsyncClient(http2=http2, timeout=30)
+
+def cache_path(url, params):
+    key = hashlib.sha256(f"{url}?{urlencode(sorted(params.items()))}".encode()).hexdigest()[:16]
+    return CACHE_DIR / f"{key}.json"
+
+async def main():
+    print("Testing NASA OSDR API...")
+    print(f"URL: {url}")
+    print(f"Params: {params}\n")
     
-    if response.status_code == 200:
-        data = response.json()
+    try:
+        cache = cache_path(url, params)
+        if cache.exists() and time.time() - cache.stat().st_mtime < CACHE_TTL:
+            print(f"Using cached response: {cache}\n")
+            data = json.loads(cache.read_bytes())
+        else:
+            async with http_client() as client:
+                response = await client.get(url, params=params)
+            print(f"Status Code: {response.status_code} ({response.http_version})")
+            print(f"Headers: {dict(response.headers)}\n")
+            
+            if response.status_code != 200:
+                print(f"ERROR: {response.text[:500]}")
+                return
+            data = response.json()
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            cache.write_bytes(response.content)
+        
         print("SUCCESS! Response structure:")
         print(json.dumps(data, indent=2)[:2000])
-    else:
-        print(f"ERROR: {response.text[:500]}")
-        
-except Exception as e:
-    print(f"EXCEPTION: {type(e).__name__}: {e}")
+            
+    except Exception as e:
+        print(f"EXCEPTION: {type(e).__name__}: {e}")
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,51 +1,94 @@
 """Debug script to save full NASA OSDR API response"""
-import requests
-import json
+import asyncio
+import hashlib
+import orjson
+import shutil
+import time
+from pathlib import Path
+from urllib.parse import urlencode
 
 url = "https://osdr.nasa.gov/osdr/data/search"
 params = {"size": 3, "from": 0}
+OUTPUT_FILE = Path("nasa_response.json")
 
-print("Fetching from NASA OSDR API...")
+# Responses are cached on disk by a hash of the request so re-runs skip the round-trip
+CACHE_DIR = Path("/tmp/nasa_cache")
+CACHE_TTL = 3600
 
-try:
-    response = requests.get(url, params=params, timeout=30)
-    
-    if response.status_code == 200:
-        data = response.json()
-        
-        # Save to file
-        with open("nasa_response.json", "w") as f:
-            json.dump(data, f, indent=2)
-        
-        print(f"✅ SUCCESS! Status: {response.status_code}")
-        print(f"✅ Response saved to: nasa_response.json")
-        print(f"\nResponse structure:")
-        print(f"  Type: {type(data)}")
-        print(f"  Keys: {list(data.keys()) if isinstance(data, dict) else 'not a dict'}")
-        
-        if isinstance(data, dict) and 'hits' in data:
-            hits = data['hits']
-            print(f"\n  hits type: {type(hits)}")
-            if isinstance(hits, dict):
-                print(f"  hits keys: {list(hits.keys())}")
-                if 'total' in hits:
-                    print(f"  total: {hits['total']}")
-                if 'hits' in hits:
-                    print(f"  hits array length: {len(hits['hits'])}")
-                    if hits['hits']:
-                        first_hit = hits['hits'][0]
-                        print(f"\n  First hit keys: {list(first_hit.keys())}")
-                        if '_source' in first_hit:
-                            source = first_hit['_source']
-                            print(f"  _source keys: {list(source.keys())[:10]}")
-                            print(f"  Study Title: {source.get('Study Title', 'N/A')}")
-                            print(f"  Study ID: {source.get('Study Identifier', first_hit.get('_id', 'N/A'))}")
-        
-        print(f"\n✅ Check nasa_response.json for full details")
-        
-    else:
-        print(f"❌ ERROR: Status {response.status_code}")
-        print(response.text[:500])
+def http_client():
+    """Build the HTTP client; httpx is imported here so cache hits never load it."""
+    import httpx
+    try:
+        import h2  # noqa: F401 - enables HTTP/2 in httpx
+        http2 = True
+    except ImportError:
+        http2 = False
+    return httpx.AsyncClient(http2=http2, timeout=30)
+
+def cache_path(url, params):
+    key = hashlib.sha256(f"{url}?{urlencode(sorted(params.items()))}".encode()).hexdigest()[:16]
+    return CACHE_DIR / f"{key}.json"
+
+async def main():
+    print("Fetching from NASA OSDR API...")
+
+    try:
+        cache = cache_path(url, params)
+        if cache.exists() and time.time() - cache.stat().st_mtime < CACHE_TTL:
+            print(f"Using cached response: {cache}")
+            shutil.copyfile(cache, OUTPUT_FILE)
+            status_code = 200
+        else:
+            # Stream the body straight to disk; the file is NASA's raw JSON, not a re-serialized copy
+            async with http_client() as client:
+                async with client.stream("GET", url, params=params) as response:
+                    if response.status_code == 200:
+                        with open(OUTPUT_FILE, "wb") as f:
+                            async for chunk in response.aiter_bytes():
+                                f.write(chunk)
+                    else:
+                        await response.aread()
+            status_code = response.status_code
+            if status_code == 200:
+                CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                shutil.copyfile(OUTPUT_FILE, cache)
         
-except Exception as e:
-    print(f"❌ EXCEPTION: {type(e).__name__}: {e}")
+        if status_code == 200:
+            # Parse only for the summary below
+            data = orjson.loads(OUTPUT_FILE.read_bytes())
+            
+            print(f"✅ SUCCESS! Status: {status_code}")
+            print(f"✅ Response saved to: nasa_response.json")
+            print(f"\nResponse structure:")
+            print(f"  Type: {type(data)}")
+            print(f"  Keys: {list(data.keys()) if isinstance(data, dict) else 'not a dict'}")
+            
+            if isinstance(data, dict) and 'hits' in data:
+                hits = data['hits']
+                print(f"\n  hits type: {type(hits)}")
+                if isinstance(hits, dict):
+                    print(f"  hits keys: {list(hits.keys())}")
+                    if 'total' in hits:
+                        print(f"  total: {hits['total']}")
+                    if 'hits' in hits:
+                        print(f"  hits array length: {len(hits['hits'])}")
+                        if hits['hits']:
+                            first_hit = hits['hits'][0]
+                            print(f"\n  First hit keys: {list(first_hit.keys())}")
+                            if '_source' in first_hit:
+                                source = first_hit['_source']
+                                print(f"  _source keys: {list(source.keys())[:10]}")
+                                print(f"  Study Title: {source.get('Study Title', 'N/A')}")
+                                print(f"  Study ID: {source.get('Study Identifier', first_hit.get('_id', 'N/A'))}")
+            
+            print(f"\n✅ Check nasa_response.json for full details")
+            
+        else:
+            print(f"❌ ERROR: Status {status_code}")
+            print(response.text[:500])
+            
+    except Exception as e:
+        print(f"❌ EXCEPTION: {type(e).__name__}: {e}")
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,21 @@
+"""Shared test fixtures."""
+
+import pytest
+
+class FakeCache:
+    """In-memory stand-in for CacheService that records the TTL of every set."""
+    
+    def __init__(self):
+        self.store = {}
+        self.ttls = {}
+    
+    async def get(self, key):
+        return self.store.get(key)
+    
+    async def set(self, key, value, ttl=None):
+        self.store[key] = value
+        self.ttls[key] = ttl
+
+@pytest.fixture
+def cache():
+    return FakeCache()
@@ -0,0 +1,29 @@
+"""/datasets result assembly (routes._fetch_datasets)."""
+
+import asyncio
+from types import SimpleNamespace
+
+from app import routes
+
+class _NASA:
+    def __init__(self, data):
+        self.data = data
+    
+    async def get_datasets(self, limit, page, with_files):
+        return self.data
+
+def _fetch(cache, data):
+    services = SimpleNamespace(cache_service=cache, nasa_client=_NASA(data))
+    return asyncio.run(routes._fetch_datasets(services, 10, 0, build_graph=False))
+
+def test_stale_flag_is_passed_through(cache):
+    result = _fetch(cache, {"data": [{"id": "OSD-1"}], "total": 1, "source": "NASA OSDR (stale)", "stale": True})
+    assert result["stale"] is True
+    assert result["source"] == "NASA OSDR (stale)"
+
+def test_fresh_result_has_no_stale_flag(cache):
+    assert "stale" not in _fetch(cache, {"data": [{"id": "OSD-1"}], "total": 1})
+
+def test_stale_result_is_cached_briefly(cache):
+    _fetch(cache, {"data": [], "total": 0, "stale": True})
+    assert list(cache.ttls.values()) == [routes.REFERENCE_ERROR_TTL]
@@ -0,0 +1,41 @@
+"""The msgspec OSDR envelope decoder feeds the dataset transform the same values as orjson."""
+
+import httpx
+import orjson
+import pytest
+
+from app import fast_schemas
+from app.nasa_client import NASAClient
+
+pytestmark = pytest.mark.skipif(not fast_schemas.MSGSPEC_AVAILABLE, reason="msgspec not installed")
+
+BODY = orjson.dumps({"hits": {"total": {"value": 3}, "hits": [
+    {"_id": "a", "_source": {
+        "Study Identifier": "OSD-1", "Study Title": "Mice", "organism": "Mus musculus",
+        "Mission": {"Name": "RR-1", "Start Date": "2014"}, "Study Assay Technology Type": "RNA-seq",
+        "Unused Field": {"large": list(range(10))},
+    }},
+    # Explicit nulls must not fall back to the alternative keys
+    {"_id": "b", "_source": {"Study Identifier": "OSD-2", "organism": None, "Material Type": "Leaf",
+                             "Study Title": None, "Mission": None}},
+    # Missing keys do fall back
+    {"_id": "c", "_source": {"Project Identifier": "P-3", "Material Type": "Root"}},
+    {"_id": "d"},
+]}})
+
+def test_decoded_hits_transform_like_orjson_hits():
+    client = NASAClient(client=httpx.AsyncClient())
+    decoded = fast_schemas.decode_osdr_search(BODY)
+    plain = orjson.loads(BODY)
+    
+    assert decoded["hits"]["total"] == plain["hits"]["total"]
+    assert len(decoded["hits"]["hits"]) == len(plain["hits"]["hits"])
+    for fast_hit, hit in zip(decoded["hits"]["hits"], plain["hits"]["hits"]):
+        assert client._transform_osdr_hit_to_dataset(fast_hit) == client._transform_osdr_hit_to_dataset(hit)
+    
+    assert decoded["hits"]["hits"][1]["_source"]["organism"] is None
+    assert "Unused Field" not in decoded["hits"]["hits"][0]["_source"]
+
+def test_other_shapes_are_left_to_orjson():
+    assert fast_schemas.decode_osdr_search(b'[{"id": "OSD-1"}]') is None
+    assert fast_schemas.decode_osdr_search(b'{"studies": []}') is None
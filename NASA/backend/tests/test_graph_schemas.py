@@ -0,0 +1,22 @@
+"""GraphResponseSoA column layout."""
+
+import pytest
+from pydantic import ValidationError
+
+from app.schemas import GraphResponseSoA
+
+def test_to_aos_round_trip():
+    soa = GraphResponseSoA(
+        node_ids=["a", "b"], node_labels=["A", "B"], node_types=["study", "organism"],
+        node_properties=[{"x": 1}, {}],
+        edge_ids=["e"], edge_sources=["a"], edge_targets=["b"], edge_labels=["studies"],
+        edge_properties=[{}],
+    )
+    aos = soa.to_aos()
+    assert [n.id for n in aos.nodes] == ["a", "b"]
+    assert aos.nodes[0].properties == {"x": 1}
+    assert (aos.edges[0].source, aos.edges[0].target) == ("a", "b")
+
+def test_misaligned_columns_are_rejected():
+    with pytest.raises(ValidationError):
+        GraphResponseSoA(node_ids=["a", "b"], node_labels=["A"], node_types=["study", "study"], node_properties=[{}, {}])
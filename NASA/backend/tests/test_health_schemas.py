@@ -0,0 +1,21 @@
+"""HealthResponse service statuses are a union discriminated by `kind`."""
+
+import pytest
+from pydantic import ValidationError
+
+from app.schemas import AIServiceStatus, HealthResponse, ServiceStatus
+
+def _health(services):
+    return HealthResponse(ok=True, timestamp="t", environment="test", version="1", services=services)
+
+def test_statuses_dispatch_on_kind():
+    health = _health({
+        "cache": {"kind": "service", "status": "healthy", "redis_available": False},
+        "ai_services": {"kind": "ai", "gemini_configured": True, "status": "healthy"},
+    })
+    assert isinstance(health.services["cache"], ServiceStatus)
+    assert isinstance(health.services["ai_services"], AIServiceStatus)
+
+def test_status_without_kind_is_rejected():
+    with pytest.raises(ValidationError):
+        _health({"cache": {"status": "healthy"}})
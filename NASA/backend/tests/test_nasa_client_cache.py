@@ -0,0 +1,61 @@
+"""In-process caches of the NASA client (hit transforms, study details)."""
+
+import httpx
+
+from app.nasa_client import NASAClient
+
+def _hit(title):
+    return {"_id": "x", "_source": {"Study Identifier": "OSD-1", "Study Title": title}}
+
+def test_transform_cache_is_keyed_by_hit_content():
+    client = NASAClient(client=httpx.AsyncClient())
+    calls = []
+    transform = client._transform_osdr_hit_to_dataset
+    client._transform_osdr_hit_to_dataset = lambda hit: calls.append(hit) or transform(hit)
+    
+    assert client._transform_osdr_hit_cached(_hit("Old"))["title"] == "Old"
+    # An unchanged hit reuses the memoized transform, however long ago it was made
+    assert client._transform_osdr_hit_cached(_hit("Old"))["title"] == "Old"
+    assert len(calls) == 1
+    # An edited study is transformed again
+    assert client._transform_osdr_hit_cached(_hit("New"))["title"] == "New"
+    assert len(calls) == 2
+
+def test_cached_details_are_decoded_once_and_copied_per_caller():
+    import asyncio
+    client = NASAClient(client=httpx.AsyncClient())
+    calls = []
+    
+    async def request(study_id):
+        calls.append(study_id)
+        return {"study_id": study_id, "data_types": ["RNA-seq"]}
+    
+    client._request_study_details = request
+    
+    async def run():
+        first = await client.get_study_details("OSD-1")
+        first["title"] = "mutated"
+        return first, await client.get_study_details("OSD-1")
+    
+    first, second = asyncio.run(run())
+    assert calls == ["OSD-1"]
+    assert "title" not in second
+    # Only the top level is copied; nested values are shared, not re-decoded
+    assert second["data_types"] is first["data_types"]
+
+def test_coalesced_details_callers_get_their_own_copy():
+    import asyncio
+    client = NASAClient(client=httpx.AsyncClient())
+    
+    async def request(study_id):
+        await asyncio.sleep(0)
+        return {"study_id": study_id, "source": "Error", "error": "timeout"}  # not cached
+    
+    client._request_study_details = request
+    
+    async def run():
+        return await asyncio.gather(*(client.get_study_details("OSD-1") for _ in range(2)))
+    
+    first, second = asyncio.run(run())
+    first["title"] = "mutated"
+    assert first is not second and "title" not in second
@@ -0,0 +1,84 @@
+"""Streaming all_files listings through ijson (NASAClient._request_files)."""
+
+import asyncio
+
+import httpx
+import orjson
+import pytest
+
+from app import nasa_client
+from app.nasa_client import NASAClient
+
+pytestmark = pytest.mark.skipif(not nasa_client.IJSON_AVAILABLE, reason="ijson not installed")
+
+FILES_BODY = orjson.dumps({
+    "files": [
+        {"file_name": "a.csv", "file_size": 10, "url": "https://example/a.csv"},
+        {"name": "b.txt", "size": 20, "download_url": "https://example/b.txt"},
+    ],
+    "total": 40,  # this page of a larger listing
+})
+
+def _client(body: bytes, chunk_size: int = 7, statuses=()):
+    requests = []
+    statuses = list(statuses)
+
+    async def chunks():
+        for i in range(0, len(body), chunk_size):
+            yield body[i:i + chunk_size]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if statuses:
+            return httpx.Response(statuses.pop(0))
+        return httpx.Response(200, content=chunks())
+
+    return NASAClient(client=httpx.AsyncClient(transport=httpx.MockTransport(handler))), requests
+
+def _request_files(client: NASAClient):
+    return asyncio.run(client._request_files("OSD-1", 0, 25, True))
+
+def test_streamed_files_are_normalized():
+    client, requests = _client(FILES_BODY)
+    result = _request_files(client)
+    
+    assert "error" not in result
+    assert [f["file_name"] for f in result["files"]] == ["a.csv", "b.txt"]
+    assert result["files"][1]["file_url"] == "https://example/b.txt"
+    assert result["total"] == 40
+    assert len(requests) == 1
+
+def test_streamed_request_is_retried(monkeypatch):
+    monkeypatch.setattr(nasa_client, "RETRY_BASE_DELAY", 0)
+    client, requests = _client(FILES_BODY, statuses=[503])
+    result = _request_files(client)
+    
+    assert len(result["files"]) == 2
+    assert len(requests) == 2
+
+def test_other_shape_reuses_streamed_body():
+    client, requests = _client(orjson.dumps([{"name": "c.fastq", "size": 5}]))
+    result = _request_files(client)
+    
+    assert [f["file_name"] for f in result["files"]] == ["c.fastq"]
+    assert len(requests) == 1
+
+def test_parse_failure_falls_back_to_buffered_parse():
+    # ijson rejects the NaN literal that orjson also rejects -> refetched, then an error payload
+    client, _ = _client(b'{"files": [{"name": "x"}, NaN]}')
+    result = _request_files(client)
+    assert result["source"] == "Error"
+    
+    # A study_files listing is not the streamed shape but parses buffered
+    client, requests = _client(orjson.dumps({"study_files": [{"file_name": "d.bin"}]}))
+    result = _request_files(client)
+    assert [f["file_name"] for f in result["files"]] == ["d.bin"]
+    assert len(requests) == 1
+
+def test_byte_reader_honours_size():
+    async def run():
+        response = httpx.Response(200, content=b"0123456789")
+        reader = nasa_client._AsyncByteReader(response)
+        return [await reader.read(0), await reader.read(4), await reader.read(), await reader.read(3)]
+    
+    assert asyncio.run(run()) == [b"", b"0123", b"456789", b""]
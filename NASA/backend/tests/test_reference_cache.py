@@ -0,0 +1,20 @@
+"""Reference data caching: failed GEODE/OSDR fetches are only held briefly."""
+
+import asyncio
+from types import SimpleNamespace
+
+from app import routes
+
+def _load(cache, data):
+    async def fetch():
+        return data
+    
+    asyncio.run(routes._load_reference(SimpleNamespace(cache_service=cache), "geode:test", fetch))
+    return cache.ttls["geode:test"]
+
+def test_partial_bundle_error_uses_short_ttl(cache):
+    bundle = {"experiments": {"experiments": [1]}, "payloads": {"payloads": [], "error": "timeout"}}
+    assert _load(cache, bundle) == routes.REFERENCE_ERROR_TTL
+
+def test_successful_reference_uses_full_ttl(cache):
+    assert _load(cache, {"organisms": ["Mus musculus"]}) == routes.REFERENCE_ETAG_TTL
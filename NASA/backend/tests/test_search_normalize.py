@@ -0,0 +1,28 @@
+"""Search hit normalization: one field-resolution rule (resolve_search_hit)."""
+
+from app import routes
+from app.schemas import SearchResult, resolve_search_hit
+
+HITS = [
+    {"id": "OSD-1", "title": "Mice on ISS", "description": "d", "organism": "Mus musculus",
+     "mission": "RR-1", "data_types": ["RNA-seq"], "score": 2.5},
+    # Falsy first key falls through to the next, like an `or` chain
+    {"id": "", "study_id": "OSD-2", "title": None, "name": "Plants", "summary": "s", "score": 3},
+    # No truthy key: the last key's value is kept
+    {"OSD_STUDY_ID": "", "name": ""},
+    # null data_types, explicit relevance_score (only `score` is read)
+    {"id": "OSD-4", "data_types": None, "relevance_score": 9.0},
+    {"id": "OSD-5", "score": None, "extra": {"ignored": True}},
+]
+
+def test_hits_resolve_like_or_chains():
+    results = routes._normalize_hits(HITS)
+    assert results == [resolve_search_hit(hit) for hit in HITS]
+    assert results[1]["id"] == "OSD-2" and results[1]["title"] == "Plants"
+    assert results[2]["id"] == "" and results[2]["title"] == ""
+    assert results[3]["data_types"] == [] and results[3]["relevance_score"] == 1.0
+    assert results[1]["relevance_score"] == 3
+
+def test_normalized_hits_match_the_response_model():
+    for result in routes._normalize_hits(HITS):
+        assert SearchResult.model_validate(result).model_dump(mode="json") == result
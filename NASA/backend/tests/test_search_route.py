@@ -0,0 +1,36 @@
+"""/search serializes the normalized results without re-validating them."""
+
+from types import SimpleNamespace
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.routes import router
+
+class _NASA:
+    async def search_studies(self, params):
+        return {"hits": [
+            {"id": "OSD-1", "title": "Mice on ISS", "score": 2.0},
+            {"id": "OSD-2", "title": 1, "score": 1.0},  # mismatched upstream type
+        ]}
+
+class _AI:
+    async def parse_intent(self, query):
+        return {"query": query}
+
+def _client(cache):
+    app = FastAPI()
+    app.include_router(router)
+    app.state.services = SimpleNamespace(cache_service=cache, nasa_client=_NASA(), ai_service=_AI())
+    return TestClient(app)
+
+def test_mismatched_hit_type_does_not_fail_search(cache):
+    client = _client(cache)
+    
+    for _ in range(2):  # fresh search, then the cached result
+        response = client.post("/search", json={"query": "mice"})
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert [r["id"] for r in results] == ["OSD-1", "OSD-2"]
+        assert results[1]["title"] == 1
+    assert len(cache.store) == 1